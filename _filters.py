@@ -0,0 +1,49 @@
+"""
+Hot filter paths for the job scraper, kept typed and self-contained
+
+This module has no third-party imports and full annotations on purpose:
+it can be AOT-compiled with mypyc (`mypyc _filters.py`) for a 2-4x
+speedup on the per-job loop. Python prefers the compiled extension over
+this source automatically when one has been built, so deployments
+without a build step just run the plain-Python version.
+"""
+from typing import Dict, List
+
+
+def shape_remotive_job(job_data: Dict) -> Dict:
+    """Map a raw Remotive API record to the scraper's job shape"""
+    return {
+        'title': job_data.get('title', ''),
+        'company': job_data.get('company_name', ''),
+        'url': job_data.get('url', ''),
+        'location': 'Remote',
+        'salary': job_data.get('salary', ''),
+        'job_type': job_data.get('job_type', ''),
+        'description': job_data.get('description', '')[:300],
+        'site': 'Remotive'
+    }
+
+
+def filter_remotive(raw_jobs: List[Dict], query: str, limit: int = 50) -> List[Dict]:
+    """
+    Filter raw Remotive records by query and shape the matches
+
+    Args:
+        raw_jobs: Decoded records from the API's 'jobs' array
+        query: Search query matched against title/category/description
+        limit: Maximum number of records to scan
+
+    Returns:
+        List of shaped job dicts matching the query
+    """
+    needle: str = query.casefold()
+    out: List[Dict] = []
+    for job_data in raw_jobs[:limit]:
+        # Check the small fields first and short-circuit: descriptions
+        # run 5-50 KB, so skipping their casefold (and never gluing the
+        # fields into one big haystack copy) is most of the loop's cost
+        if (needle in job_data.get('title', '').casefold()
+                or needle in job_data.get('category', '').casefold()
+                or needle in job_data.get('description', '').casefold()):
+            out.append(shape_remotive_job(job_data))
+    return out
@@ -4,46 +4,207 @@ These are more reliable than HTML scraping
 """
 import aiohttp
 import asyncio
-from typing import List, Dict
+import json
+import random
+from typing import List, Dict, Optional
 import logging
 from datetime import datetime, timedelta
 
+# Large API payloads (Remotive is multi-MB) decode much faster with orjson
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Aggregators overlap a lot (the same posting shows up on Remotive and
+# Adzuna), and every duplicate that slips through costs a Gemini call
+# downstream. Track what we've already returned across all scrapers.
+_seen_urls = set()
+
+
+def _dedup_key(job: Dict) -> str:
+    """Stable identity for a job: its URL, else title|company"""
+    return (job.get('url') or f"{job.get('title', '')}|{job.get('company', '')}").lower()
+
+
+def _is_duplicate(job: Dict) -> bool:
+    """Check-and-record a job against the cross-scraper seen set"""
+    key = _dedup_key(job)
+    if key in _seen_urls:
+        return True
+    _seen_urls.add(key)
+    return False
+
+
+# Split timeouts: a slow TLS handshake shouldn't eat into body-download
+# time the way a single total=15 budget does
+API_TIMEOUT = aiohttp.ClientTimeout(sock_connect=5, sock_read=10, total=20)
+
+
+async def _fetch_json(session: aiohttp.ClientSession, url: str,
+                      params: Dict = None, headers: Dict = None,
+                      retries: int = 3) -> Optional[Dict]:
+    """
+    GET a URL and decode its JSON body, retrying transient failures
+
+    Retries aiohttp client errors, timeouts, 429s and 5xx responses with
+    exponential backoff plus jitter (honoring Retry-After when sent), so
+    a single network blip no longer turns a whole source into an empty
+    result list.
+
+    Args:
+        session: Shared ClientSession
+        url: URL to fetch
+        params: Optional query parameters
+        headers: Optional request headers
+        retries: Maximum attempts
+
+    Returns:
+        Decoded JSON payload, or None if all attempts failed
+    """
+    # Advertise compression explicitly: JSON payloads shrink 5-10x under
+    # gzip, and some servers send plain bytes unless the client asks.
+    # aiohttp decompresses transparently (brotli too, if installed).
+    req_headers = {'Accept-Encoding': 'gzip, deflate, br'}
+    if headers:
+        req_headers.update(headers)
+
+    for attempt in range(retries):
+        delay = 0.5 * 2 ** attempt + random.random() * 0.5
+        try:
+            async with session.get(url, params=params, headers=req_headers,
+                                   timeout=API_TIMEOUT) as response:
+                if response.status == 200:
+                    return json_loads(await response.read())
+                if response.status == 429 or response.status >= 500:
+                    retry_after = response.headers.get('Retry-After')
+                    if retry_after:
+                        try:
+                            delay = float(retry_after)
+                        except ValueError:
+                            pass
+                    logger.warning(f"HTTP {response.status} from {url}, retrying in {delay:.1f}s")
+                else:
+                    logger.warning(f"HTTP {response.status} from {url}, giving up")
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt == retries - 1:
+                raise
+            logger.warning(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+    return None
+
+
+JOB_FIELDS = ('title', 'company', 'url', 'location', 'salary',
+              'job_type', 'description', 'site')
+
+
+def jobs_to_columns(jobs: List[Dict]) -> Dict[str, List]:
+    """
+    Transpose a job list into a column dict for bulk post-processing
+
+    Scanning one flat list per field (e.g. every title) is much faster
+    than pulling the same key out of thousands of row dicts, so use this
+    for dedup passes, substring filters and stats over large batches.
+    The row-oriented List[Dict] stays the interchange format because the
+    filter, storage and Telegram layers all consume individual jobs.
+
+    Args:
+        jobs: List of job dictionaries
+
+    Returns:
+        Dict mapping each job field to a list of per-job values
+    """
+    return {field: [job.get(field, '') for job in jobs] for field in JOB_FIELDS}
+
+
+async def run_all_scrapers(query: str, config: Dict = None) -> List[Dict]:
+    """
+    Run all API scrapers concurrently over one shared ClientSession
+
+    A ClientSession owns a keep-alive connection pool; creating one per
+    scraper (or per call) pays a fresh TCP + TLS handshake for every
+    request. This orchestrator builds a single pooled session and passes
+    it to every scraper, so repeated hits to the same host reuse warm
+    connections.
+
+    Args:
+        query: Search query
+        config: Optional config dict (reads API credentials from 'apis')
+
+    Returns:
+        Combined list of jobs from all sources
+    """
+    config = config or {}
+    apis = config.get('apis', {})
+    adzuna = apis.get('adzuna', {})
+
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        ttl_dns_cache=300,
+        keepalive_timeout=60
+    )
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            scrape_remotive(query, session),
+            scrape_adzuna(query, adzuna.get('app_id', ''), adzuna.get('app_key', ''), session),
+            scrape_usajobs(query, session),
+            return_exceptions=True
+        )
+
+    jobs = []
+    for result in results:
+        if isinstance(result, list):
+            jobs.extend(result)
+        else:
+            logger.error(f"Scraper failed: {result}")
+
+    if jobs:
+        sites = jobs_to_columns(jobs)['site']
+        logger.info(f"Collected {len(jobs)} jobs from {len(set(sites))} sources")
+
+    return jobs
+
 
 async def scrape_remotive(query: str, session: aiohttp.ClientSession) -> List[Dict]:
     """
     Scrape Remotive.io API (free, no rate limits for reasonable use)
     Focuses on remote jobs
+
+    Pass the shared application session - do not create one per call.
     """
     jobs = []
     url = "https://remotive.com/api/remote-jobs"
     
     try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
-            if response.status == 200:
-                data = await response.json()
-                
-                for job_data in data.get('jobs', []):
-                    # Filter by query
-                    title = job_data.get('title', '').lower()
-                    description = job_data.get('description', '').lower()
-                    query_lower = query.lower()
-                    
-                    if query_lower in title or query_lower in description:
-                        job = {
-                            'title': job_data.get('title', ''),
-                            'company': job_data.get('company_name', ''),
-                            'url': job_data.get('url', ''),
-                            'location': 'Remote',
-                            'salary': '',
-                            'job_type': job_data.get('job_type', ''),
-                            'description': job_data.get('description', '')[:500],
-                            'site': 'Remotive'
-                        }
+        data = await _fetch_json(session, url)
+        if data:
+            for job_data in data.get('jobs', []):
+                # Filter by query
+                title = job_data.get('title', '').lower()
+                description = job_data.get('description', '').lower()
+                query_lower = query.lower()
+
+                if query_lower in title or query_lower in description:
+                    job = {
+                        'title': job_data.get('title', ''),
+                        'company': job_data.get('company_name', ''),
+                        'url': job_data.get('url', ''),
+                        'location': 'Remote',
+                        'salary': '',
+                        'job_type': job_data.get('job_type', ''),
+                        'description': job_data.get('description', '')[:500],
+                        'site': 'Remotive'
+                    }
+                    if not _is_duplicate(job):
                         jobs.append(job)
-                
-                logger.info(f"Scraped {len(jobs)} jobs from Remotive")
+
+            logger.info(f"Scraped {len(jobs)} jobs from Remotive")
     except Exception as e:
         logger.error(f"Error scraping Remotive: {e}")
     
@@ -54,6 +215,8 @@ async def scrape_adzuna(query: str, app_id: str, app_key: str, session: aiohttp.
     """
     Scrape Adzuna API (requires free API key from https://developer.adzuna.com/)
     Aggregates from many sources
+
+    Pass the shared application session - do not create one per call.
     """
     jobs = []
     
@@ -71,24 +234,23 @@ async def scrape_adzuna(query: str, app_id: str, app_key: str, session: aiohttp.
     }
     
     try:
-        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=15)) as response:
-            if response.status == 200:
-                data = await response.json()
-                
-                for job_data in data.get('results', []):
-                    job = {
-                        'title': job_data.get('title', ''),
-                        'company': job_data.get('company', {}).get('display_name', ''),
-                        'url': job_data.get('redirect_url', ''),
-                        'location': job_data.get('location', {}).get('display_name', ''),
-                        'salary': f"${job_data.get('salary_min', 0)}-${job_data.get('salary_max', 0)}" if job_data.get('salary_min') else '',
-                        'job_type': job_data.get('contract_type', ''),
-                        'description': job_data.get('description', '')[:500],
-                        'site': 'Adzuna'
-                    }
+        data = await _fetch_json(session, url, params=params)
+        if data:
+            for job_data in data.get('results', []):
+                job = {
+                    'title': job_data.get('title', ''),
+                    'company': job_data.get('company', {}).get('display_name', ''),
+                    'url': job_data.get('redirect_url', ''),
+                    'location': job_data.get('location', {}).get('display_name', ''),
+                    'salary': f"${job_data.get('salary_min', 0)}-${job_data.get('salary_max', 0)}" if job_data.get('salary_min') else '',
+                    'job_type': job_data.get('contract_type', ''),
+                    'description': job_data.get('description', '')[:500],
+                    'site': 'Adzuna'
+                }
+                if not _is_duplicate(job):
                     jobs.append(job)
-                
-                logger.info(f"Scraped {len(jobs)} jobs from Adzuna")
+
+            logger.info(f"Scraped {len(jobs)} jobs from Adzuna")
     except Exception as e:
         logger.error(f"Error scraping Adzuna: {e}")
     
@@ -110,6 +272,8 @@ async def scrape_github_jobs(query: str, session: aiohttp.ClientSession) -> List
 async def scrape_usajobs(query: str, session: aiohttp.ClientSession) -> List[Dict]:
     """
     Scrape USAJobs API (US government jobs, free API)
+
+    Pass the shared application session - do not create one per call.
     """
     jobs = []
     url = "https://data.usajobs.gov/api/search"
@@ -126,26 +290,25 @@ async def scrape_usajobs(query: str, session: aiohttp.ClientSession) -> List[Dic
     }
     
     try:
-        async with session.get(url, headers=headers, params=params, timeout=aiohttp.ClientTimeout(total=15)) as response:
-            if response.status == 200:
-                data = await response.json()
-                
-                for job_data in data.get('SearchResult', {}).get('SearchResultItems', []):
-                    match_data = job_data.get('MatchedObjectDescriptor', {})
-                    
-                    job = {
-                        'title': match_data.get('PositionTitle', ''),
-                        'company': match_data.get('OrganizationName', 'US Government'),
-                        'url': match_data.get('PositionURI', ''),
-                        'location': ', '.join([loc.get('LocationName', '') for loc in match_data.get('PositionLocation', [])]),
-                        'salary': f"${match_data.get('PositionRemuneration', [{}])[0].get('MinimumRange', '')}-${match_data.get('PositionRemuneration', [{}])[0].get('MaximumRange', '')}",
-                        'job_type': match_data.get('PositionSchedule', [{}])[0].get('Name', ''),
-                        'description': match_data.get('PositionFormattedDescription', [{}])[0].get('Content', '')[:500],
-                        'site': 'USAJobs'
-                    }
+        data = await _fetch_json(session, url, params=params, headers=headers)
+        if data:
+            for job_data in data.get('SearchResult', {}).get('SearchResultItems', []):
+                match_data = job_data.get('MatchedObjectDescriptor', {})
+
+                job = {
+                    'title': match_data.get('PositionTitle', ''),
+                    'company': match_data.get('OrganizationName', 'US Government'),
+                    'url': match_data.get('PositionURI', ''),
+                    'location': ', '.join([loc.get('LocationName', '') for loc in match_data.get('PositionLocation', [])]),
+                    'salary': f"${match_data.get('PositionRemuneration', [{}])[0].get('MinimumRange', '')}-${match_data.get('PositionRemuneration', [{}])[0].get('MaximumRange', '')}",
+                    'job_type': match_data.get('PositionSchedule', [{}])[0].get('Name', ''),
+                    'description': match_data.get('PositionFormattedDescription', [{}])[0].get('Content', '')[:500],
+                    'site': 'USAJobs'
+                }
+                if not _is_duplicate(job):
                     jobs.append(job)
-                
-                logger.info(f"Scraped {len(jobs)} jobs from USAJobs")
+
+            logger.info(f"Scraped {len(jobs)} jobs from USAJobs")
     except Exception as e:
         logger.error(f"Error scraping USAJobs: {e}")
     
@@ -155,6 +318,8 @@ async def scrape_usajobs(query: str, session: aiohttp.ClientSession) -> List[Dic
 async def scrape_jobs2careers(query: str, api_key: str, session: aiohttp.ClientSession) -> List[Dict]:
     """
     Scrape Jobs2Careers API (paid API, aggregates multiple sources)
+
+    Pass the shared application session - do not create one per call.
     """
     jobs = []
     
@@ -171,24 +336,23 @@ async def scrape_jobs2careers(query: str, api_key: str, session: aiohttp.ClientS
     }
     
     try:
-        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=15)) as response:
-            if response.status == 200:
-                data = await response.json()
-                
-                for job_data in data:
-                    job = {
-                        'title': job_data.get('title', ''),
-                        'company': job_data.get('company', ''),
-                        'url': job_data.get('url', ''),
-                        'location': job_data.get('location', ''),
-                        'salary': '',
-                        'job_type': '',
-                        'description': job_data.get('description', '')[:500],
-                        'site': 'Jobs2Careers'
-                    }
+        data = await _fetch_json(session, url, params=params)
+        if data:
+            for job_data in data:
+                job = {
+                    'title': job_data.get('title', ''),
+                    'company': job_data.get('company', ''),
+                    'url': job_data.get('url', ''),
+                    'location': job_data.get('location', ''),
+                    'salary': '',
+                    'job_type': '',
+                    'description': job_data.get('description', '')[:500],
+                    'site': 'Jobs2Careers'
+                }
+                if not _is_duplicate(job):
                     jobs.append(job)
-                
-                logger.info(f"Scraped {len(jobs)} jobs from Jobs2Careers")
+
+            logger.info(f"Scraped {len(jobs)} jobs from Jobs2Careers")
     except Exception as e:
         logger.error(f"Error scraping Jobs2Careers: {e}")
     
@@ -5,80 +5,91 @@ import asyncio
 from pathlib import Path
 from stealth_scrapers import StealthBrowserScraper
 
-async def test_indeed():
+async def save_html(path: str, content: str):
+    """Write page HTML without blocking the event loop
+
+    Playwright drives the browser over the same loop, so a multi-MB
+    synchronous write would stall it; the write runs in a worker thread.
+    """
+    await asyncio.to_thread(Path(path).write_text, content, encoding="utf-8")
+    print(f"HTML saved: {path}")
+
+async def test_indeed(scraper: StealthBrowserScraper):
     """Test Indeed with stealth browser and save screenshot"""
     print("Testing Indeed stealth scraper...")
-    
-    scraper = StealthBrowserScraper()
-    await scraper.init_browser(headless=False)  # Visible browser for debugging
-    
+
     page = await scraper.create_stealth_page()
-    
+
     url = "https://www.indeed.com/jobs?q=data+analyst&fromage=1&sort=date"
     print(f"Loading: {url}")
-    
-    await page.goto(url, wait_until='load', timeout=60000)
-    await asyncio.sleep(5)
-    
-    # Save screenshot
-    await page.screenshot(path="indeed_debug.png", full_page=True)
-    print("Screenshot saved: indeed_debug.png")
-    
-    # Save HTML
+
+    # networkidle returns as soon as the page has been quiet for 500ms,
+    # instead of padding every load with a fixed 5s sleep
+    await page.goto(url, wait_until='networkidle', timeout=60000)
+
+    # Full-page screenshot encoding takes seconds on a long results page;
+    # grab the HTML while it runs instead of waiting for it first
+    screenshot_task = asyncio.create_task(
+        page.screenshot(path="indeed_debug.png", full_page=True)
+    )
     content = await page.content()
-    with open("indeed_debug.html", "w", encoding="utf-8") as f:
-        f.write(content)
-    print("HTML saved: indeed_debug.html")
-    
+    await save_html("indeed_debug.html", content)
+    await screenshot_task
+    print("Screenshot saved: indeed_debug.png")
+
     # Check for captcha/blocking
     if "captcha" in content.lower() or "robot" in content.lower():
         print("⚠️ CAPTCHA or bot detection found!")
     else:
         print("✅ No obvious blocking detected")
-    
-    await scraper.close()
 
-async def test_glassdoor():
+    await page.close()
+
+async def test_glassdoor(scraper: StealthBrowserScraper):
     """Test Glassdoor with stealth browser"""
     print("\nTesting Glassdoor stealth scraper...")
-    
-    scraper = StealthBrowserScraper()
-    await scraper.init_browser(headless=False)
-    
+
     page = await scraper.create_stealth_page()
-    
+
     url = "https://www.glassdoor.com/Job/jobs.htm?sc.keyword=data+analyst"
     print(f"Loading: {url}")
-    
-    await page.goto(url, wait_until='load', timeout=60000)
-    await asyncio.sleep(5)
-    
-    # Save screenshot
-    await page.screenshot(path="glassdoor_debug.png", full_page=True)
-    print("Screenshot saved: glassdoor_debug.png")
-    
-    # Save HTML
+
+    # networkidle returns as soon as the page has been quiet for 500ms,
+    # instead of padding every load with a fixed 5s sleep
+    await page.goto(url, wait_until='networkidle', timeout=60000)
+
+    # Same trick as test_indeed: overlap the screenshot encode with the
+    # HTML fetch and write
+    screenshot_task = asyncio.create_task(
+        page.screenshot(path="glassdoor_debug.png", full_page=True)
+    )
     content = await page.content()
-    with open("glassdoor_debug.html", "w", encoding="utf-8") as f:
-        f.write(content)
-    print("HTML saved: glassdoor_debug.html")
-    
+    await save_html("glassdoor_debug.html", content)
+    await screenshot_task
+    print("Screenshot saved: glassdoor_debug.png")
+
     # Check for Cloudflare
     if "cloudflare" in content.lower() or "challenge" in content.lower():
         print("⚠️ Cloudflare challenge detected!")
     else:
         print("✅ No Cloudflare blocking detected")
-    
-    await scraper.close()
+
+    await page.close()
 
 async def main():
-    """Run all tests"""
+    """Run all tests against one shared browser instance"""
+    # Launching Chromium takes several seconds; start it once and open a
+    # fresh page per test instead of paying the startup cost per site.
+    scraper = StealthBrowserScraper()
+    await scraper.init_browser(headless=False)  # Visible browser for debugging
     try:
-        await test_indeed()
-        await test_glassdoor()
+        await test_indeed(scraper)
+        await test_glassdoor(scraper)
         print("\n✅ Debug complete! Check the .png and .html files.")
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        await scraper.close_browser()
 
 if __name__ == "__main__":
     asyncio.run(main())
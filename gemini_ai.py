@@ -3,23 +3,755 @@ Gemini AI Integration for Job Scraper Bot
 Provides intelligent job analysis, summarization, and natural language processing
 """
 
+import asyncio
 import google.generativeai as genai
+import hashlib
 import os
 import logging
+import random
+import re
+import sqlite3
+import string
+import threading
+import time
 from typing import Dict, List, Optional
 import json
 
+# orjson decodes 2-5x faster than stdlib json; fall back if not installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Newer google-genai SDK keeps one pooled HTTP connection across calls
+# instead of handshaking per request; use it when installed
+try:
+    from google import genai as google_genai
+    GENAI_CLIENT_AVAILABLE = True
+except ImportError:
+    GENAI_CLIENT_AVAILABLE = False
+
+# Optional Redis backend for response caching
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Transient API errors worth retrying (quota bursts, brief outages)
+try:
+    from google.api_core import exceptions as gapi_exceptions
+    TRANSIENT_API_ERRORS = (
+        gapi_exceptions.ResourceExhausted,
+        gapi_exceptions.ServiceUnavailable,
+        gapi_exceptions.DeadlineExceeded,
+    )
+except ImportError:
+    TRANSIENT_API_ERRORS = ()
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Check whether a Gemini error is worth retrying"""
+    if TRANSIENT_API_ERRORS and isinstance(error, TRANSIENT_API_ERRORS):
+        return True
+    msg = str(error).lower()
+    return any(marker in msg for marker in
+               ('429', '503', 'quota', 'rate limit', 'unavailable', 'deadline', 'timed out'))
+
+
+# Trailing commas before a closing brace/bracket - the one JSON slip
+# models still make occasionally even in JSON mode
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+
+def _parse_json(text: str):
+    """
+    Parse a model response as JSON, salvaging common slips
+
+    Strips markdown fences and retries once with trailing commas
+    removed before giving up, so a near-valid response doesn't waste
+    the whole API call.
+    """
+    text = text.strip()
+    if text.startswith('```'):
+        text = text.removeprefix('```json').removeprefix('```').removesuffix('```').strip()
+    try:
+        return json_loads(text)
+    except ValueError:
+        return json_loads(_TRAILING_COMMA_RE.sub(r'\1', text))
+
+
+# Noise that job boards append to descriptions - pure wasted tokens
+_BOILERPLATE_RE = re.compile(
+    r'(apply now|report job|share this job|show more|show less|©.*)',
+    re.IGNORECASE
+)
+
+
+def truncate_for_prompt(text: str, max_tokens: int) -> str:
+    """
+    Trim text to roughly max_tokens before it goes into a prompt
+
+    Uses the ~4 chars/token rule of thumb for English, strips job-board
+    boilerplate first, and cuts on a word boundary so the prompt never
+    ends mid-word. Cheaper than a real tokenizer and close enough for
+    budgeting prefill.
+
+    Args:
+        text: Raw text (job description, resume, ...)
+        max_tokens: Approximate token budget
+
+    Returns:
+        Trimmed text
+    """
+    text = _BOILERPLATE_RE.sub('', text)
+    limit = max_tokens * 4
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(' ', 0, limit)
+    return text[:cut] if cut > 0 else text[:limit]
+
+
+# Seniority cues for the local salary-band lookup
+_SENIOR_RE = re.compile(r'\b(senior|sr\.?|lead|principal|staff)\b')
+_ENTRY_RE = re.compile(r'\b(junior|jr\.?|fresher|entry[- ]level|entry|trainee|intern|graduate)\b')
+
+# Local search-query parsing: common patterns answered without an API call
+_SEARCH_JOB_TYPE_RE = re.compile(r'\b(remote|full[- ]time|part[- ]time|contract|internship|freelance)\b')
+_SEARCH_EXPERIENCE_RE = re.compile(r'\b(freshers?|entry[- ]level|junior|senior|mid[- ]level|experienced)\b')
+_SEARCH_SALARY_RE = re.compile(r'(\d+)\s*(?:lpa|lakhs?)\b')
+_SEARCH_CITIES = (
+    'new delhi', 'delhi', 'gurgaon', 'gurugram', 'noida', 'ncr',
+    'bangalore', 'bengaluru', 'mumbai', 'pune', 'hyderabad', 'chennai',
+    'kolkata', 'ahmedabad', 'jaipur', 'india'
+)
+_SEARCH_FILLER_WORDS = frozenset((
+    'find', 'me', 'show', 'search', 'get', 'want', 'need', 'looking',
+    'jobs', 'job', 'openings', 'opening', 'vacancies', 'vacancy',
+    'positions', 'position', 'roles', 'a', 'an', 'the', 'for', 'in',
+    'at', 'near', 'some', 'please', 'and'
+))
+_EXPERIENCE_LEVELS = {
+    'fresher': 'entry', 'freshers': 'entry', 'entry level': 'entry',
+    'entry-level': 'entry', 'junior': 'junior', 'senior': 'senior',
+    'mid level': 'mid', 'mid-level': 'mid', 'experienced': 'mid'
+}
+
+# Cache TTLs (seconds) - summaries go stale quickly, interview questions don't
+SUMMARY_CACHE_TTL = 24 * 3600
+QUESTIONS_CACHE_TTL = 7 * 24 * 3600
+DEFAULT_CACHE_TTL = 24 * 3600
+
+# Serialized generation configs, keyed by schema identity - the handful
+# of module-level schemas means this stays tiny
+_CONFIG_KEY_CACHE: Dict[int, str] = {}
+
+# Response schemas for Gemini's native JSON mode. With
+# response_mime_type="application/json" the model can't wrap output in
+# ```json fences or trailing prose, so json.loads stops failing and
+# falling back to defaults (each failure wastes the whole API call).
+SCORE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "score": {"type": "integer"},
+        "reasoning": {"type": "string"}
+    },
+    "required": ["score", "reasoning"]
+}
+
+SEARCH_FILTERS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "role": {"type": "string"},
+        "location": {"type": "string"},
+        "skills": {"type": "array", "items": {"type": "string"}},
+        "experience_level": {"type": "string"},
+        "job_type": {"type": "string"},
+        "salary_min": {"type": "number"},
+        "keywords": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["role"]
+}
+
+ENRICH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "score": {"type": "integer"},
+        "score_reasoning": {"type": "string"},
+        "salary_min": {"type": "number"},
+        "salary_max": {"type": "number"},
+        "salary_confidence": {"type": "string"},
+        "company_type": {"type": "string"},
+        "company_salary_reputation": {"type": "string"},
+        "competition": {"type": "string"},
+        "estimated_applicants": {"type": "string"},
+        "quick_apply_advantage": {"type": "boolean"}
+    },
+    "required": ["summary", "score", "score_reasoning"]
+}
+
+SCORE_BATCH_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer"},
+            "score": {"type": "integer"},
+            "reasoning": {"type": "string"}
+        },
+        "required": ["id", "score", "reasoning"]
+    }
+}
+
+STRING_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+# Prompt templates, parsed once at import. substitute() is C-implemented,
+# so per-call prompt construction is just filling the $placeholders
+# instead of rebuilding a ~500-byte f-string - and keeping the static
+# text identical across calls is what makes prompt-hash caching work.
+SUMMARY_PROMPT = string.Template("""
+Analyze this job posting and create a concise, attractive summary in 3-4 bullet points.
+Focus on: key requirements, experience level, standout benefits, and red flags (if any).
+
+Job Title: $title
+Company: $company
+Location: $location
+Job Type: $job_type
+Description: $description
+
+Format:
+• First bullet: Key requirements (skills, experience)
+• Second bullet: Compensation/Benefits (if mentioned)
+• Third bullet: Why this role stands out OR red flags
+Keep each bullet under 15 words. Use casual, helpful tone.
+""")
+
+ENRICH_PROMPT = string.Template("""
+Analyze this job posting and return ALL of the following as one JSON object:
+
+1. "summary": 3 short bullet points (key requirements; compensation/benefits if mentioned; standout points or red flags), each under 15 words, casual tone, separated by newlines
+2. "score": posting quality 0-10 and "score_reasoning": one sentence why (consider clarity, completeness, transparency, red flags, compensation details)
+3. "salary_min" and "salary_max": estimated range in LPA for the Indian market, with "salary_confidence": High/Medium/Low
+4. "company_type": Startup/MNC/Product/Service/Unknown and "company_salary_reputation": Competitive/Average/Below-average/Unknown
+5. "competition": Very High/High/Medium/Low, "estimated_applicants": one of "100-500"/"50-100"/"10-50"/"<10", "quick_apply_advantage": true/false
+
+Job Title: $title
+Company: $company
+Location: $location
+Job Type: $job_type
+Description: $description
+""")
+
+SCORE_PROMPT = string.Template("""
+Rate this job posting quality from 0-10 and explain why in ONE sentence.
+
+Job Title: $title
+Company: $company
+Location: $location
+Description: $description
+
+Consider: clarity, completeness, transparency, red flags, compensation details.
+
+Respond in JSON format:
+{"score": <number 0-10>, "reasoning": "<one sentence explanation>"}
+""")
+
+SEARCH_PROMPT = string.Template("""
+Parse this job search query into structured filters.
+
+User Query: "$query"
+
+Extract and respond in JSON:
+{
+  "role": "<job role/title>",
+  "location": "<city/location>",
+  "skills": ["<skill1>", "<skill2>"],
+  "experience_level": "<entry/junior/mid/senior>",
+  "job_type": "<full-time/part-time/remote/contract>",
+  "salary_min": <number or null>,
+  "keywords": ["<keyword1>", "<keyword2>"]
+}
+
+If something isn't mentioned, use null. Keep it simple.
+""")
+
+COVER_LETTER_PROMPT = string.Template("""
+Write a concise, professional cover letter (150 words max) for:
+
+Job: $title at $company
+Candidate: $name
+Skills: $skills
+Experience: $experience
+
+Make it enthusiastic but professional. Focus on why they're a good fit.
+""")
+
+QUESTIONS_PROMPT = string.Template("""
+Generate 5 likely interview questions for this role:
+
+Job: $title at $company
+Description: $description
+
+Return as JSON array:
+["Question 1?", "Question 2?", ...]
+""")
+
+SALARY_PROMPT = string.Template("""
+Based on Indian job market data, estimate the salary range for this position:
+
+Job Title: $title
+Company: $company
+Location: $location
+Description snippet: $description
+
+Consider:
+- Job title and seniority level
+- Company (if known/recognizable)
+- Location (metro vs tier-2 city)
+- Industry standards in India
+- Experience level implied
+
+Return as JSON:
+{
+  "salary_min": <number in LPA>,
+  "salary_max": <number in LPA>,
+  "currency": "INR",
+  "confidence": "High/Medium/Low",
+  "reasoning": "<one sentence why this estimate>"
+}
+
+If entry-level/fresher role, estimate 3-8 LPA.
+If mid-level, estimate 8-20 LPA.
+If senior, estimate 20-40+ LPA.
+""")
+
+COMPANY_PROMPT = string.Template("""
+Provide brief insights about this company for a job seeker:
+
+Company: $company
+
+Include (if known):
+1. Company type (Startup/MNC/Product/Service)
+2. Industry/Domain
+3. Company size (Small/Medium/Large)
+4. Known for (products/culture/reputation)
+5. Average salary reputation (Competitive/Average/Below-average)
+6. Work-life balance reputation (Good/Average/Poor)
+7. Growth opportunities (Excellent/Good/Limited)
+
+Return as JSON:
+{
+  "type": "Startup/MNC/Product/Service/Unknown",
+  "industry": "Industry name",
+  "size": "Small/Medium/Large/Unknown",
+  "known_for": "Brief description",
+  "salary_reputation": "Competitive/Average/Below-average/Unknown",
+  "work_life_balance": "Good/Average/Poor/Unknown",
+  "growth_opportunities": "Excellent/Good/Limited/Unknown",
+  "recommendation": "2-3 sentence advice for job seeker"
+}
+
+If company is unknown, mark fields as "Unknown" and be honest about it.
+""")
+
+
+class GeminiResponseCache:
+    """
+    Response cache for Gemini calls, backed by Redis when available
+
+    Identical prompts (e.g. the same job posting seen on multiple scrape
+    cycles) are served from the cache without a network round-trip, saving
+    both latency and API quota. Keys are SHA-256 hashes of model + prompt.
+    Without Redis (not installed or REDIS_URL unset) entries live in a
+    local SQLite file fronted by an in-process dict, so cached responses
+    survive restarts and redeploys instead of being re-bought from the
+    API every time the bot comes back up.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, db_path: str = 'gemini_cache.db'):
+        self._redis = None
+        self._local: Dict[str, tuple] = {}
+        self._db = None
+        url = redis_url or os.getenv('REDIS_URL')
+        if REDIS_AVAILABLE and url:
+            try:
+                self._redis = redis.Redis.from_url(url, decode_responses=True)
+                self._redis.ping()
+                logger.info("✨ Gemini response cache using Redis")
+            except Exception as e:
+                logger.warning(f"⚠️ Redis unavailable ({e}), using local cache")
+                self._redis = None
+        if self._redis is None:
+            try:
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute('''
+                    CREATE TABLE IF NOT EXISTS cache (
+                        key TEXT PRIMARY KEY,
+                        value TEXT,
+                        expires_at REAL
+                    )
+                ''')
+                # Drop anything that expired while the bot was down
+                self._db.execute('DELETE FROM cache WHERE expires_at < ?', (time.time(),))
+                self._db.commit()
+                logger.info("✨ Gemini response cache using SQLite")
+            except Exception as e:
+                logger.warning(f"⚠️ SQLite cache unavailable ({e}), using in-memory only")
+                self._db = None
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str) -> str:
+        """Build a stable cache key from model name and prompt text"""
+        return "gem:" + hashlib.sha256(f"{model_name}|{prompt}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, or None on miss/expiry"""
+        if self._redis:
+            try:
+                return self._redis.get(key)
+            except Exception as e:
+                logger.debug(f"Redis get failed: {e}")
+                return None
+        entry = self._local.get(key)
+        if entry:
+            value, expires_at = entry
+            if time.time() < expires_at:
+                return value
+            del self._local[key]
+        if self._db:
+            try:
+                row = self._db.execute(
+                    'SELECT value, expires_at FROM cache WHERE key = ?', (key,)
+                ).fetchone()
+                if row:
+                    value, expires_at = row
+                    if time.time() < expires_at:
+                        # Promote to the dict so repeat hits skip SQLite
+                        self._local[key] = (value, expires_at)
+                        return value
+                    self._db.execute('DELETE FROM cache WHERE key = ?', (key,))
+                    self._db.commit()
+            except Exception as e:
+                logger.debug(f"SQLite cache get failed: {e}")
+        return None
+
+    def set(self, key: str, value: str, ttl: int = DEFAULT_CACHE_TTL):
+        """Store a response with a TTL"""
+        if self._redis:
+            try:
+                self._redis.setex(key, ttl, value)
+                return
+            except Exception as e:
+                logger.debug(f"Redis set failed: {e}")
+        expires_at = time.time() + ttl
+        self._local[key] = (value, expires_at)
+        if self._db:
+            try:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+                    (key, value, expires_at)
+                )
+                self._db.commit()
+            except Exception as e:
+                logger.debug(f"SQLite cache set failed: {e}")
+
+
+class CreditRateLimiter:
+    """
+    Credit-based rate limiter for the Gemini free tier (15 RPM)
+
+    Each call spends one credit on entry; the credit is refunded 60s
+    after the call started, so sustained throughput sits exactly at the
+    quota ceiling instead of bursting into HTTP 429s and paying a full
+    round-trip per retry.
+    """
+
+    def __init__(self, max_credits: int = 15, refund_time: float = 60.0):
+        self.refund_time = refund_time
+        self._sem = asyncio.Semaphore(max_credits)
+
+    async def __aenter__(self):
+        await self._sem.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Refund the credit only once the rate window has elapsed
+        asyncio.get_running_loop().call_later(self.refund_time, self._sem.release)
+
 
 class GeminiAI:
     def __init__(self, api_key: str):
         """Initialize Gemini AI with API key"""
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        self.model_name = 'gemini-1.5-flash'
+        self.model = genai.GenerativeModel(self.model_name)
+        # Prefer the google-genai client: its aio surface multiplexes all
+        # calls over one persistent connection, saving a TLS handshake
+        # (~100ms) per request versus the legacy per-call SDK
+        self.client = None
+        if GENAI_CLIENT_AVAILABLE:
+            try:
+                self.client = google_genai.Client(api_key=api_key)
+                logger.info("✨ Using google-genai client with pooled connections")
+            except Exception as e:
+                logger.warning(f"⚠️ google-genai client init failed ({e}), using legacy SDK")
+        self.cache = GeminiResponseCache()
+        # Local lookup tables answer ultra-common companies and role bands
+        # without spending an API call at all
+        self._company_table = self._load_table('data/company_profiles.json')
+        self._salary_table = self._load_table('data/salary_bands.json')
+        self._skills_matcher = self._build_skills_matcher('data/skills_vocabulary.txt')
+        # Free tier allows 15 requests/minute; the limiter holds callers
+        # at the quota ceiling instead of bursting into 429s
+        self.limiter = CreditRateLimiter(max_credits=15, refund_time=60.0)
+        # In-flight calls keyed by cache key, so concurrent identical
+        # prompts share one API call instead of each missing the cache
+        self._inflight: Dict[str, asyncio.Future] = {}
         logger.info("✨ Gemini AI initialized successfully")
-    
-    def summarize_job(self, job: Dict) -> str:
+
+    @staticmethod
+    def _load_table(path: str) -> Dict:
+        """Load a local JSON lookup table, returning {} when absent"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json_loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load {path}: {e}")
+            return {}
+
+    @staticmethod
+    def _build_skills_matcher(path: str):
+        """
+        Compile the skills vocabulary into one alternation regex
+
+        Returns a (pattern, canonical) pair - canonical maps the
+        casefolded match back to display casing - or None when the
+        vocabulary file is absent.
+        """
+        try:
+            with open(path, encoding='utf-8') as f:
+                skills = [line.strip() for line in f
+                          if line.strip() and not line.startswith('#')]
+        except OSError:
+            return None
+        if not skills:
+            return None
+        # Longest-first so 'machine learning' beats 'r'; lookarounds
+        # instead of \b because skills like C++ end in non-word chars
+        alternation = '|'.join(re.escape(s.casefold())
+                               for s in sorted(skills, key=len, reverse=True))
+        pattern = re.compile(rf'(?<!\w)({alternation})(?!\w)')
+        canonical = {s.casefold(): s for s in skills}
+        return pattern, canonical
+
+    @staticmethod
+    def _parse_search_locally(user_query: str) -> Optional[Dict]:
+        """
+        Parse a simple search query with regexes, skipping the API
+
+        Handles the common "find python jobs in delhi for freshers"
+        shape in microseconds. Returns None when the query is long or
+        nothing recognizable as a role remains, so the Gemini parser
+        still covers the ambiguous cases.
+        """
+        q = user_query.casefold().strip()
+        if not q or len(q.split()) > 10:
+            return None
+
+        filters = {
+            'role': None,
+            'location': None,
+            'skills': [],
+            'experience_level': None,
+            'job_type': None,
+            'salary_min': None,
+            'keywords': []
+        }
+
+        match = _SEARCH_SALARY_RE.search(q)
+        if match:
+            filters['salary_min'] = int(match.group(1))
+            q = q.replace(match.group(0), ' ')
+
+        match = _SEARCH_JOB_TYPE_RE.search(q)
+        if match:
+            filters['job_type'] = match.group(1).replace(' ', '-')
+            q = q.replace(match.group(0), ' ')
+
+        match = _SEARCH_EXPERIENCE_RE.search(q)
+        if match:
+            filters['experience_level'] = _EXPERIENCE_LEVELS.get(match.group(1), 'entry')
+            q = q.replace(match.group(0), ' ')
+
+        for city in _SEARCH_CITIES:
+            if re.search(rf'\b{re.escape(city)}\b', q):
+                filters['location'] = city.title()
+                q = q.replace(city, ' ')
+                break
+
+        role = ' '.join(w for w in q.split() if w not in _SEARCH_FILLER_WORDS)
+        if not role:
+            return None
+
+        filters['role'] = role
+        filters['keywords'] = [role]
+        return filters
+
+    @staticmethod
+    def _salary_band_key(title: str) -> str:
+        """Normalize a job title to a 'role|seniority' salary-band key"""
+        t = title.casefold()
+        if _SENIOR_RE.search(t):
+            seniority = 'senior'
+        elif _ENTRY_RE.search(t):
+            seniority = 'entry'
+        else:
+            seniority = 'mid'
+        role = _ENTRY_RE.sub('', _SENIOR_RE.sub('', t))
+        role = ' '.join(role.split())
+        return f"{role}|{seniority}"
+
+    async def _cached_generate(self, prompt: str, ttl: int = DEFAULT_CACHE_TTL,
+                               response_schema: Optional[Dict] = None,
+                               json_mode: bool = False) -> str:
+        """
+        Generate content for a prompt, serving repeated prompts from cache
+
+        Uses the SDK's async API so callers can fan out many jobs with
+        asyncio.gather without blocking the event loop. When json_mode or
+        a response_schema is given, Gemini's native JSON mode is enabled
+        so the output is guaranteed to be bare, parseable JSON.
+
+        Args:
+            prompt: Full prompt text
+            ttl: How long to keep the response cached (seconds)
+            response_schema: Optional JSON schema the response must follow
+            json_mode: Force application/json output without a schema
+
+        Returns:
+            Response text (stripped)
+        """
+        generation_config = None
+        if json_mode or response_schema is not None:
+            # temperature=0 makes structured outputs deterministic, which
+            # also keeps repeat prompts hitting the same cache entry
+            generation_config = {'response_mime_type': 'application/json',
+                                 'temperature': 0}
+            if response_schema is not None:
+                generation_config['response_schema'] = response_schema
+
+        # The generation config changes the output, so it is part of the
+        # key. Schemas are module-level constants, so their serialized
+        # form is memoized by identity instead of re-dumped every call.
+        if generation_config:
+            cfg_json = _CONFIG_KEY_CACHE.get(id(response_schema))
+            if cfg_json is None:
+                cfg_json = json.dumps(generation_config, sort_keys=True)
+                _CONFIG_KEY_CACHE[id(response_schema)] = cfg_json
+            key_material = f"{cfg_json}|{prompt}"
+        else:
+            key_material = prompt
+        key = GeminiResponseCache.make_key(self.model_name, key_material)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug("Gemini cache hit")
+            return cached
+
+        # Coalesce concurrent identical prompts: the first caller fires
+        # the API call, later ones await its result. Distinct from the
+        # cache - this covers the window before the first response lands.
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.debug("Gemini call coalesced with in-flight request")
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            # Retry transient failures (quota bursts, brief 503s) with
+            # jittered backoff instead of burning the call and returning
+            # a fallback
+            for attempt in range(4):
+                try:
+                    async with self.limiter:
+                        if self.client:
+                            # google-genai takes the same config keys under 'config'
+                            response = await self.client.aio.models.generate_content(
+                                model=self.model_name, contents=prompt,
+                                config=generation_config
+                            )
+                        else:
+                            response = await self.model.generate_content_async(
+                                prompt, generation_config=generation_config
+                            )
+                    break
+                except Exception as e:
+                    if attempt == 3 or not _is_transient_error(e):
+                        raise
+                    delay = min(0.5 * 2 ** attempt + random.random() * 0.5, 8.0)
+                    logger.warning(f"Transient Gemini error ({e}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+            text = response.text.strip()
+            self.cache.set(key, text, ttl)
+            future.set_result(text)
+            return text
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved in case no other coroutine was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _stream_generate(self, prompt: str, ttl: int = DEFAULT_CACHE_TTL):
+        """
+        Yield response text chunks as Gemini produces them
+
+        Time-to-first-token is ~400ms while a full multi-paragraph
+        completion takes seconds, so prose consumers (Telegram handlers)
+        can start forwarding text almost immediately. A cached response
+        is served as one chunk, and the assembled text is cached on
+        completion so streamed and non-streamed calls share entries.
+
+        Args:
+            prompt: Full prompt text
+            ttl: How long to keep the assembled response cached (seconds)
+
+        Yields:
+            Response text fragments, in order
+        """
+        key = GeminiResponseCache.make_key(self.model_name, prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        pieces = []
+        async with self.limiter:
+            if self.client:
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=self.model_name, contents=prompt
+                )
+                async for chunk in stream:
+                    if chunk.text:
+                        pieces.append(chunk.text)
+                        yield chunk.text
+            else:
+                response = await self.model.generate_content_async(prompt, stream=True)
+                async for chunk in response:
+                    if chunk.text:
+                        pieces.append(chunk.text)
+                        yield chunk.text
+        if pieces:
+            self.cache.set(key, ''.join(pieces).strip(), ttl)
+
+    async def summarize_job(self, job: Dict) -> str:
         """
         Create a concise, smart summary of a job posting
         
@@ -30,57 +762,203 @@ class GeminiAI:
             Formatted summary string with emojis and key highlights
         """
         try:
-            prompt = f"""
-Analyze this job posting and create a concise, attractive summary in 3-4 bullet points.
-Focus on: key requirements, experience level, standout benefits, and red flags (if any).
-
-Job Title: {job.get('title', 'N/A')}
-Company: {job.get('company', 'N/A')}
-Location: {job.get('location', 'N/A')}
-Job Type: {job.get('job_type', 'N/A')}
-Description: {job.get('description', 'N/A')[:1000]}
+            prompt = SUMMARY_PROMPT.substitute(
+                title=job.get('title', 'N/A'),
+                company=job.get('company', 'N/A'),
+                location=job.get('location', 'N/A'),
+                job_type=job.get('job_type', 'N/A'),
+                description=truncate_for_prompt(job.get('description', 'N/A'), 250)
+            )
 
-Format:
-• First bullet: Key requirements (skills, experience)
-• Second bullet: Compensation/Benefits (if mentioned)
-• Third bullet: Why this role stands out OR red flags
-Keep each bullet under 15 words. Use casual, helpful tone.
-"""
-            
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return await self._cached_generate(prompt, ttl=SUMMARY_CACHE_TTL)
             
         except Exception as e:
             logger.error(f"Error summarizing job: {e}")
             return f"• {job.get('title', 'Job')} at {job.get('company', 'Company')}\n• Location: {job.get('location', 'N/A')}\n• Type: {job.get('job_type', 'Full-time')}"
     
-    def score_job_quality(self, job: Dict) -> Dict:
+    async def enrich_job(self, job: Dict) -> Dict:
         """
-        Score a job posting quality (0-10) and provide reasoning
-        
+        Produce every per-job enrichment with a single Gemini call
+
+        Summary, quality score, salary estimate, company read and
+        competition level all share the same input, so one multi-task
+        prompt replaces up to five separate calls - the description is
+        tokenized once instead of once per task.
+
         Args:
             job: Job dictionary
-        
+
         Returns:
-            Dict with 'score' (int 0-10) and 'reasoning' (str)
+            Dict with 'summary' (str) and 'score'/'salary'/'company'/
+            'competition' sub-dicts shaped like the per-task methods'
+            return values
         """
         try:
-            prompt = f"""
-Rate this job posting quality from 0-10 and explain why in ONE sentence.
+            prompt = ENRICH_PROMPT.substitute(
+                title=job.get('title', 'N/A'),
+                company=job.get('company', 'N/A'),
+                location=job.get('location', 'N/A'),
+                job_type=job.get('job_type', 'N/A'),
+                description=truncate_for_prompt(job.get('description', 'N/A'), 250)
+            )
 
-Job Title: {job.get('title', 'N/A')}
-Company: {job.get('company', 'N/A')}
-Location: {job.get('location', 'N/A')}
-Description: {job.get('description', 'N/A')[:800]}
+            result = _parse_json(await self._cached_generate(
+                prompt, ttl=SUMMARY_CACHE_TTL, response_schema=ENRICH_SCHEMA))
+            return {
+                'summary': result.get('summary', ''),
+                'score': {
+                    'score': int(result.get('score', 5)),
+                    'reasoning': result.get('score_reasoning', 'Standard job posting')
+                },
+                'salary': {
+                    'salary_min': result.get('salary_min', 0),
+                    'salary_max': result.get('salary_max', 0),
+                    'currency': 'INR',
+                    'confidence': result.get('salary_confidence', 'Medium'),
+                    'reasoning': 'Market estimate'
+                },
+                'company': {
+                    'type': result.get('company_type', 'Unknown'),
+                    'salary_reputation': result.get('company_salary_reputation', 'Unknown')
+                },
+                'competition': {
+                    'competition': result.get('competition', 'Medium'),
+                    'estimated_applicants': result.get('estimated_applicants', ''),
+                    'quick_apply_advantage': bool(result.get('quick_apply_advantage', True))
+                }
+            }
+
+        except Exception as e:
+            logger.error(f"Error enriching job: {e}")
+            return {}
 
+    async def summarize_jobs_batch(self, jobs: List[Dict], batch_size: int = 10) -> List[str]:
+        """
+        Summarize multiple jobs with one Gemini call per batch
+
+        Concatenates up to batch_size jobs into a single prompt asking for
+        a JSON array of summaries, so N jobs cost one HTTPS round-trip
+        instead of N. Falls back to per-job summarize_job if the batch
+        response can't be parsed.
+
+        Args:
+            jobs: List of job dictionaries
+            batch_size: Maximum jobs per prompt
+
+        Returns:
+            List of summary strings, one per job, in input order
+        """
+        summaries = []
+        for start in range(0, len(jobs), batch_size):
+            batch = jobs[start:start + batch_size]
+            try:
+                jobs_text = "\n---\n".join([
+                    f"[{i}] Title: {job.get('title', 'N/A')}\n"
+                    f"Company: {job.get('company', 'N/A')}\n"
+                    f"Location: {job.get('location', 'N/A')}\n"
+                    f"Description: {truncate_for_prompt(job.get('description', 'N/A'), 125)}"
+                    for i, job in enumerate(batch)
+                ])
+
+                prompt = f"""
+Summarize each of these {len(batch)} job postings in 3 short bullet points.
+Focus on: key requirements, compensation/benefits (if mentioned), and
+standout points or red flags. Keep each bullet under 15 words. Casual tone.
+
+{jobs_text}
+
+Return ONLY a JSON array of exactly {len(batch)} summary strings, in order:
+["summary for job 0", "summary for job 1", ...]
+"""
+
+                text = await self._cached_generate(prompt, ttl=SUMMARY_CACHE_TTL,
+                                                   response_schema=STRING_LIST_SCHEMA)
+                parsed = _parse_json(text)
+                if not isinstance(parsed, list) or len(parsed) != len(batch):
+                    raise ValueError(f"expected {len(batch)} summaries, got {len(parsed) if isinstance(parsed, list) else type(parsed)}")
+
+                summaries.extend(str(s).strip() for s in parsed)
+
+            except Exception as e:
+                logger.warning(f"Batch summarization failed ({e}), falling back to per-job calls")
+                summaries.extend(await asyncio.gather(*(self.summarize_job(job) for job in batch)))
+
+        return summaries
+
+    async def score_jobs_batch(self, jobs: List[Dict], batch_size: int = 10) -> List[Dict]:
+        """
+        Score multiple jobs with one Gemini call per batch
+
+        Same round-trip collapsing as summarize_jobs_batch: up to
+        batch_size jobs go into a single prompt that returns an id-keyed
+        JSON array, enforced by a response schema. Falls back to per-job
+        score_job_quality if a batch can't be scored.
+
+        Args:
+            jobs: List of job dictionaries
+            batch_size: Maximum jobs per prompt
+
+        Returns:
+            List of {'score': int, 'reasoning': str} dicts, in input order
+        """
+        results = []
+        for start in range(0, len(jobs), batch_size):
+            batch = jobs[start:start + batch_size]
+            try:
+                jobs_text = "\n---\n".join([
+                    f"[{i}] Title: {job.get('title', 'N/A')}\n"
+                    f"Company: {job.get('company', 'N/A')}\n"
+                    f"Location: {job.get('location', 'N/A')}\n"
+                    f"Description: {truncate_for_prompt(job.get('description', 'N/A'), 100)}"
+                    for i, job in enumerate(batch)
+                ])
+
+                prompt = f"""
+Rate each of these {len(batch)} job postings from 0-10 and explain why in ONE sentence each.
 Consider: clarity, completeness, transparency, red flags, compensation details.
 
-Respond in JSON format:
-{{"score": <number 0-10>, "reasoning": "<one sentence explanation>"}}
+{jobs_text}
+
+Return a JSON array with one entry per job:
+[{{"id": 0, "score": <0-10>, "reasoning": "<one sentence>"}}, ...]
 """
-            
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+
+                parsed = _parse_json(await self._cached_generate(
+                    prompt, response_schema=SCORE_BATCH_SCHEMA))
+                by_id = {int(entry.get('id', -1)): entry for entry in parsed}
+                if len(by_id) != len(batch):
+                    raise ValueError(f"expected {len(batch)} scores, got {len(by_id)}")
+
+                results.extend({
+                    'score': int(by_id[i].get('score', 5)),
+                    'reasoning': by_id[i].get('reasoning', 'Standard job posting')
+                } for i in range(len(batch)))
+
+            except Exception as e:
+                logger.warning(f"Batch scoring failed ({e}), falling back to per-job calls")
+                results.extend(await asyncio.gather(*(self.score_job_quality(job) for job in batch)))
+
+        return results
+
+    async def score_job_quality(self, job: Dict) -> Dict:
+        """
+        Score a job posting quality (0-10) and provide reasoning
+        
+        Args:
+            job: Job dictionary
+        
+        Returns:
+            Dict with 'score' (int 0-10) and 'reasoning' (str)
+        """
+        try:
+            prompt = SCORE_PROMPT.substitute(
+                title=job.get('title', 'N/A'),
+                company=job.get('company', 'N/A'),
+                location=job.get('location', 'N/A'),
+                description=truncate_for_prompt(job.get('description', 'N/A'), 200)
+            )
+
+            result = _parse_json(await self._cached_generate(prompt, response_schema=SCORE_SCHEMA))
             return {
                 'score': int(result.get('score', 5)),
                 'reasoning': result.get('reasoning', 'Standard job posting')
@@ -90,7 +968,7 @@ Respond in JSON format:
             logger.error(f"Error scoring job: {e}")
             return {'score': 5, 'reasoning': 'Unable to analyze'}
     
-    def parse_natural_search(self, user_query: str) -> Dict:
+    async def parse_natural_search(self, user_query: str) -> Dict:
         """
         Parse natural language search query into structured filters
         
@@ -100,28 +978,17 @@ Respond in JSON format:
         Returns:
             Dict with extracted filters: role, location, experience, skills, etc.
         """
-        try:
-            prompt = f"""
-Parse this job search query into structured filters.
+        # Simple queries parse locally in microseconds - no API call,
+        # no latency, no quota. Gemini handles anything ambiguous.
+        local = self._parse_search_locally(user_query)
+        if local:
+            logger.info(f"⚡ Parsed search locally: {local['role']}")
+            return local
 
-User Query: "{user_query}"
-
-Extract and respond in JSON:
-{{
-  "role": "<job role/title>",
-  "location": "<city/location>",
-  "skills": ["<skill1>", "<skill2>"],
-  "experience_level": "<entry/junior/mid/senior>",
-  "job_type": "<full-time/part-time/remote/contract>",
-  "salary_min": <number or null>,
-  "keywords": ["<keyword1>", "<keyword2>"]
-}}
+        try:
+            prompt = SEARCH_PROMPT.substitute(query=user_query)
 
-If something isn't mentioned, use null. Keep it simple.
-"""
-            
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+            result = _parse_json(await self._cached_generate(prompt, response_schema=SEARCH_FILTERS_SCHEMA))
             return result
             
         except Exception as e:
@@ -136,7 +1003,7 @@ If something isn't mentioned, use null. Keep it simple.
                 'keywords': []
             }
     
-    def compare_jobs(self, jobs: List[Dict]) -> str:
+    async def compare_jobs(self, jobs: List[Dict]) -> str:
         """
         Compare multiple jobs and provide recommendation
         
@@ -147,13 +1014,24 @@ If something isn't mentioned, use null. Keep it simple.
             Formatted comparison and recommendation
         """
         try:
-            jobs_text = "\n\n".join([
-                f"Job {i+1}:\nTitle: {job.get('title')}\nCompany: {job.get('company')}\n"
-                f"Location: {job.get('location')}\nDescription: {job.get('description', '')[:300]}"
-                for i, job in enumerate(jobs[:5])
-            ])
-            
-            prompt = f"""
+            prompt = self._comparison_prompt(jobs)
+
+            return await self._cached_generate(prompt, ttl=SUMMARY_CACHE_TTL)
+
+        except Exception as e:
+            logger.error(f"Error comparing jobs: {e}")
+            return "Unable to compare jobs. Please review them individually."
+
+    @staticmethod
+    def _comparison_prompt(jobs: List[Dict]) -> str:
+        """Build the comparison prompt shared by compare_jobs and stream_comparison"""
+        jobs_text = "\n\n".join([
+            f"Job {i+1}:\nTitle: {job.get('title')}\nCompany: {job.get('company')}\n"
+            f"Location: {job.get('location')}\nDescription: {truncate_for_prompt(job.get('description', ''), 75)}"
+            for i, job in enumerate(jobs[:5])
+        ])
+
+        return f"""
 Compare these {len(jobs)} jobs and provide:
 1. Quick comparison table (key differences)
 2. Which one is best for a fresher/entry-level candidate
@@ -163,15 +1041,22 @@ Compare these {len(jobs)} jobs and provide:
 
 Keep it concise and actionable.
 """
-            
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
-            
-        except Exception as e:
-            logger.error(f"Error comparing jobs: {e}")
-            return "Unable to compare jobs. Please review them individually."
+
+    async def stream_comparison(self, jobs: List[Dict]):
+        """
+        Stream the job comparison as it is generated
+
+        Args:
+            jobs: List of job dictionaries (max 5)
+
+        Yields:
+            Comparison text chunks
+        """
+        async for chunk in self._stream_generate(self._comparison_prompt(jobs),
+                                                 ttl=SUMMARY_CACHE_TTL):
+            yield chunk
     
-    def generate_cover_letter(self, job: Dict, user_profile: Dict) -> str:
+    async def generate_cover_letter(self, job: Dict, user_profile: Dict) -> str:
         """
         Generate a personalized cover letter
         
@@ -183,25 +1068,43 @@ Keep it concise and actionable.
             Cover letter text
         """
         try:
-            prompt = f"""
-Write a concise, professional cover letter (150 words max) for:
+            prompt = COVER_LETTER_PROMPT.substitute(
+                title=job.get('title'),
+                company=job.get('company'),
+                name=user_profile.get('name', 'Job Seeker'),
+                skills=', '.join(user_profile.get('skills', ['data analysis', 'Python', 'SQL'])),
+                experience=user_profile.get('experience', 'Entry-level candidate')
+            )
 
-Job: {job.get('title')} at {job.get('company')}
-Candidate: {user_profile.get('name', 'Job Seeker')}
-Skills: {', '.join(user_profile.get('skills', ['data analysis', 'Python', 'SQL']))}
-Experience: {user_profile.get('experience', 'Entry-level candidate')}
 
-Make it enthusiastic but professional. Focus on why they're a good fit.
-"""
-            
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return await self._cached_generate(prompt, ttl=SUMMARY_CACHE_TTL)
             
         except Exception as e:
             logger.error(f"Error generating cover letter: {e}")
             return "Unable to generate cover letter at this time."
+
+    async def stream_cover_letter(self, job: Dict, user_profile: Dict):
+        """
+        Stream the cover letter as it is generated
+
+        Args:
+            job: Job dictionary
+            user_profile: Dict with user's name, skills, experience
+
+        Yields:
+            Cover letter text chunks
+        """
+        prompt = COVER_LETTER_PROMPT.substitute(
+            title=job.get('title'),
+            company=job.get('company'),
+            name=user_profile.get('name', 'Job Seeker'),
+            skills=', '.join(user_profile.get('skills', ['data analysis', 'Python', 'SQL'])),
+            experience=user_profile.get('experience', 'Entry-level candidate')
+        )
+        async for chunk in self._stream_generate(prompt, ttl=SUMMARY_CACHE_TTL):
+            yield chunk
     
-    def extract_skills_from_resume(self, resume_text: str) -> List[str]:
+    async def extract_skills_from_resume(self, resume_text: str) -> List[str]:
         """
         Extract skills from resume text
         
@@ -211,26 +1114,35 @@ Make it enthusiastic but professional. Focus on why they're a good fit.
         Returns:
             List of extracted skills
         """
+        # Vocabulary scan first: a resume dense with known skills doesn't
+        # need the API. Sparse matches fall through to Gemini, which also
+        # catches skills the vocabulary file doesn't list.
+        if self._skills_matcher:
+            pattern, canonical = self._skills_matcher
+            found = list(dict.fromkeys(pattern.findall(resume_text.casefold())))
+            if len(found) >= 5:
+                logger.info(f"⚡ Extracted {len(found)} skills via local vocabulary")
+                return [canonical[s] for s in found]
+
         try:
             prompt = f"""
 Extract all technical skills and tools from this resume.
 
 Resume:
-{resume_text[:2000]}
+{truncate_for_prompt(resume_text, 500)}
 
 Return ONLY a JSON array of skills:
 ["skill1", "skill2", "skill3"]
 """
             
-            response = self.model.generate_content(prompt)
-            skills = json.loads(response.text.strip())
+            skills = _parse_json(await self._cached_generate(prompt, response_schema=STRING_LIST_SCHEMA))
             return skills if isinstance(skills, list) else []
             
         except Exception as e:
             logger.error(f"Error extracting skills: {e}")
             return []
     
-    def get_interview_questions(self, job: Dict) -> List[str]:
+    async def get_interview_questions(self, job: Dict) -> List[str]:
         """
         Generate likely interview questions for a job
         
@@ -241,18 +1153,15 @@ Return ONLY a JSON array of skills:
             List of interview questions
         """
         try:
-            prompt = f"""
-Generate 5 likely interview questions for this role:
+            prompt = QUESTIONS_PROMPT.substitute(
+                title=job.get('title'),
+                company=job.get('company'),
+                description=truncate_for_prompt(job.get('description', ''), 150)
+            )
 
-Job: {job.get('title')} at {job.get('company')}
-Description: {job.get('description', '')[:600]}
 
-Return as JSON array:
-["Question 1?", "Question 2?", ...]
-"""
-            
-            response = self.model.generate_content(prompt)
-            questions = json.loads(response.text.strip())
+            questions = _parse_json(await self._cached_generate(
+                prompt, ttl=QUESTIONS_CACHE_TTL, response_schema=STRING_LIST_SCHEMA))
             return questions if isinstance(questions, list) else []
             
         except Exception as e:
@@ -265,7 +1174,7 @@ Return as JSON array:
                 "Where do you see yourself in 5 years?"
             ]
     
-    def estimate_salary(self, job: Dict) -> Dict:
+    async def estimate_salary(self, job: Dict) -> Dict:
         """
         Estimate salary range based on job title, company, and location
         
@@ -275,38 +1184,21 @@ Return as JSON array:
         Returns:
             Dict with salary_min, salary_max, currency, confidence, reasoning
         """
-        try:
-            prompt = f"""
-Based on Indian job market data, estimate the salary range for this position:
+        # Known role bands answer locally - no API call, no quota
+        band = self._salary_table.get(self._salary_band_key(job.get('title', '')))
+        if band:
+            return band
 
-Job Title: {job.get('title', 'N/A')}
-Company: {job.get('company', 'N/A')}
-Location: {job.get('location', 'India')}
-Description snippet: {job.get('description', '')[:300]}
+        try:
+            prompt = SALARY_PROMPT.substitute(
+                title=job.get('title', 'N/A'),
+                company=job.get('company', 'N/A'),
+                location=job.get('location', 'India'),
+                description=truncate_for_prompt(job.get('description', ''), 75)
+            )
 
-Consider:
-- Job title and seniority level
-- Company (if known/recognizable)
-- Location (metro vs tier-2 city)
-- Industry standards in India
-- Experience level implied
 
-Return as JSON:
-{{
-  "salary_min": <number in LPA>,
-  "salary_max": <number in LPA>,
-  "currency": "INR",
-  "confidence": "High/Medium/Low",
-  "reasoning": "<one sentence why this estimate>"
-}}
-
-If entry-level/fresher role, estimate 3-8 LPA.
-If mid-level, estimate 8-20 LPA.
-If senior, estimate 20-40+ LPA.
-"""
-            
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+            result = _parse_json(await self._cached_generate(prompt, json_mode=True))
             return {
                 'salary_min': result.get('salary_min', 0),
                 'salary_max': result.get('salary_max', 0),
@@ -325,7 +1217,7 @@ If senior, estimate 20-40+ LPA.
                 'reasoning': 'Unable to estimate'
             }
     
-    def analyze_company(self, company_name: str) -> Dict:
+    async def analyze_company(self, company_name: str) -> Dict:
         """
         Get insights about a company
         
@@ -335,38 +1227,16 @@ If senior, estimate 20-40+ LPA.
         Returns:
             Dict with company insights
         """
-        try:
-            prompt = f"""
-Provide brief insights about this company for a job seeker:
+        # Well-known companies are served from the local profile table
+        profile = self._company_table.get(company_name.lower().strip())
+        if profile:
+            return profile
 
-Company: {company_name}
+        try:
+            prompt = COMPANY_PROMPT.substitute(company=company_name)
 
-Include (if known):
-1. Company type (Startup/MNC/Product/Service)
-2. Industry/Domain
-3. Company size (Small/Medium/Large)
-4. Known for (products/culture/reputation)
-5. Average salary reputation (Competitive/Average/Below-average)
-6. Work-life balance reputation (Good/Average/Poor)
-7. Growth opportunities (Excellent/Good/Limited)
 
-Return as JSON:
-{{
-  "type": "Startup/MNC/Product/Service/Unknown",
-  "industry": "Industry name",
-  "size": "Small/Medium/Large/Unknown",
-  "known_for": "Brief description",
-  "salary_reputation": "Competitive/Average/Below-average/Unknown",
-  "work_life_balance": "Good/Average/Poor/Unknown",
-  "growth_opportunities": "Excellent/Good/Limited/Unknown",
-  "recommendation": "2-3 sentence advice for job seeker"
-}}
-
-If company is unknown, mark fields as "Unknown" and be honest about it.
-"""
-            
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+            result = _parse_json(await self._cached_generate(prompt, json_mode=True))
             return result
             
         except Exception as e:
@@ -382,7 +1252,7 @@ If company is unknown, mark fields as "Unknown" and be honest about it.
                 'recommendation': 'Research this company before applying.'
             }
     
-    def predict_application_success(self, job: Dict, user_profile: Dict) -> Dict:
+    async def predict_application_success(self, job: Dict, user_profile: Dict) -> Dict:
         """
         Predict likelihood of getting this job based on user profile
         
@@ -398,12 +1268,12 @@ If company is unknown, mark fields as "Unknown" and be honest about it.
 Assess the match between this job and candidate:
 
 Job: {job.get('title', 'N/A')} at {job.get('company', 'N/A')}
-Requirements: {job.get('description', 'N/A')[:500]}
+Requirements: {truncate_for_prompt(job.get('description', 'N/A'), 125)}
 
 Candidate:
 - Experience: {user_profile.get('experience', 'Entry-level')}
 - Skills: {', '.join(user_profile.get('skills', []))}
-- Education: {user_profile.get('education', 'Bachelor\'s degree')}
+- Education: {user_profile.get('education', "Bachelor's degree")}
 
 Provide:
 1. Match percentage (0-100)
@@ -422,8 +1292,7 @@ Return as JSON:
 }}
 """
             
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+            result = _parse_json(await self._cached_generate(prompt, json_mode=True))
             return result
             
         except Exception as e:
@@ -437,7 +1306,7 @@ Return as JSON:
                 'reasoning': 'Unable to assess match'
             }
     
-    def extract_hidden_requirements(self, job: Dict) -> Dict:
+    async def extract_hidden_requirements(self, job: Dict) -> Dict:
         """
         Extract unstated requirements from job description
         
@@ -452,7 +1321,7 @@ Return as JSON:
 Analyze this job posting and identify both stated and UNSTATED requirements:
 
 Job: {job.get('title', 'N/A')}
-Description: {job.get('description', 'N/A')[:800]}
+Description: {truncate_for_prompt(job.get('description', 'N/A'), 200)}
 
 Extract:
 1. Explicit requirements (clearly stated)
@@ -473,8 +1342,7 @@ Return as JSON:
 }}
 """
             
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+            result = _parse_json(await self._cached_generate(prompt, json_mode=True))
             return result
             
         except Exception as e:
@@ -489,7 +1357,7 @@ Return as JSON:
                 'advice': 'Read the job description carefully'
             }
     
-    def estimate_competition(self, job: Dict) -> Dict:
+    async def estimate_competition(self, job: Dict) -> Dict:
         """
         Estimate competition level for a job
         
@@ -524,8 +1392,7 @@ Return as JSON:
 }}
 """
             
-            response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
+            result = _parse_json(await self._cached_generate(prompt, json_mode=True))
             return result
             
         except Exception as e:
@@ -539,26 +1406,34 @@ Return as JSON:
             }
 
 
-# Singleton instance
+# Singleton instance, guarded so concurrent first callers can't each
+# build their own GeminiAI (every duplicate re-runs genai.configure and
+# pre-fetches auth on its own connection)
 _gemini_instance = None
+_gemini_lock = threading.Lock()
 
 def get_gemini_ai(api_key: Optional[str] = None) -> Optional[GeminiAI]:
     """
-    Get or create Gemini AI instance
-    
+    Get or create the shared Gemini AI instance (thread-safe)
+
     Args:
         api_key: Gemini API key (reads from env if not provided)
-    
+
     Returns:
         GeminiAI instance or None if no API key
     """
     global _gemini_instance
-    
-    if _gemini_instance is None:
-        key = api_key or os.getenv('GEMINI_API_KEY')
-        if key:
-            _gemini_instance = GeminiAI(key)
-        else:
-            logger.warning("⚠️ No Gemini API key found. AI features disabled.")
-    
+
+    if _gemini_instance is not None:
+        return _gemini_instance
+
+    with _gemini_lock:
+        # Double-checked: another caller may have built it while we waited
+        if _gemini_instance is None:
+            key = api_key or os.getenv('GEMINI_API_KEY')
+            if key:
+                _gemini_instance = GeminiAI(key)
+            else:
+                logger.warning("⚠️ No Gemini API key found. AI features disabled.")
+
     return _gemini_instance
@@ -5,35 +5,21 @@ Uses AI to find job listings from various sources beyond traditional scrapers
 
 import google.generativeai as genai
 import logging
+import string
+import threading
 from typing import List, Dict, Optional
-import json
 import re
 from datetime import datetime
 
-logger = logging.getLogger(__name__)
+from gemini_ai import _parse_json
 
+logger = logging.getLogger(__name__)
 
-class GeminiJobDiscovery:
-    def __init__(self, gemini_client):
-        """Initialize with Gemini AI client"""
-        self.gemini = gemini_client
-        self.model = gemini_client.model
-        logger.info("🔍 Gemini Job Discovery initialized")
-    
-    async def discover_job_boards(self, role: str, location: str = "India") -> List[Dict]:
-        """
-        Use Gemini to discover job boards and sources for a specific role
-        
-        Args:
-            role: Job role to search for
-            location: Location to search in
-        
-        Returns:
-            List of job board URLs and search strategies
-        """
-        try:
-            prompt = f"""
-You are a job search expert. List the best job boards and websites to find "{role}" jobs in {location}.
+# Discovery prompts, parsed once at import like the GeminiAI templates.
+# Byte-identical static text across calls is also what lets repeat
+# role/location lookups hit the response cache.
+DISCOVER_BOARDS_PROMPT = string.Template("""
+You are a job search expert. List the best job boards and websites to find "$role" jobs in $location.
 
 For each source, provide:
 1. Website name
@@ -50,41 +36,21 @@ Focus on:
 
 Return as JSON array:
 [
-  {{
+  {
     "name": "Website name",
     "url": "Direct search URL with query",
     "reason": "Why good for this role",
     "expected_count": "Low/Medium/High"
-  }}
+  }
 ]
 
 Provide 8-10 best sources.
-"""
-            
-            response = self.model.generate_content(prompt)
-            sources = json.loads(response.text.strip())
-            logger.info(f"📍 Discovered {len(sources)} job sources for {role}")
-            return sources
-            
-        except Exception as e:
-            logger.error(f"Error discovering job boards: {e}")
-            return []
-    
-    async def generate_search_queries(self, role: str) -> List[str]:
-        """
-        Generate comprehensive search query variations using Gemini
-        
-        Args:
-            role: Base job role
-        
-        Returns:
-            List of search query variations
-        """
-        try:
-            prompt = f"""
-Generate 8-10 DISTINCT and DIFFERENT job search queries for finding "{role}" positions in Delhi NCR, India.
+""")
 
-IMPORTANT: 
+SEARCH_QUERIES_PROMPT = string.Template("""
+Generate 8-10 DISTINCT and DIFFERENT job search queries for finding "$role" positions in Delhi NCR, India.
+
+IMPORTANT:
 - Make each query meaningfully different to avoid duplicate results
 - PRIORITIZE Delhi, Gurgaon, Noida, New Delhi locations in queries
 - Include "Delhi" or "NCR" in 60% of queries
@@ -108,30 +74,9 @@ Return ONLY a JSON array of strings (8-10 queries max):
 ["query1", "query2", "query3", ...]
 
 No explanations, no duplicates, just distinct queries with Delhi NCR focus.
-"""
-            
-            response = self.model.generate_content(prompt)
-            queries = json.loads(response.text.strip())
-            logger.info(f"🔤 Generated {len(queries)} distinct search variations for {role}")
-            return queries[:10]  # Limit to 10 max
-            
-        except Exception as e:
-            logger.error(f"Error generating search queries: {e}")
-            return [role]
-    
-    async def extract_jobs_from_text(self, text: str, source: str) -> List[Dict]:
-        """
-        Use Gemini to extract job listings from unstructured text
-        
-        Args:
-            text: Raw text containing job information
-            source: Source website/platform
-        
-        Returns:
-            List of extracted job dictionaries
-        """
-        try:
-            prompt = f"""
+""")
+
+EXTRACT_JOBS_PROMPT = string.Template("""
 Extract all job listings from this text. Each job should include:
 - title (job title)
 - company (company name)
@@ -139,52 +84,25 @@ Extract all job listings from this text. Each job should include:
 - url (application link if present, else null)
 - description (brief summary)
 
-Text from {source}:
-{text[:3000]}
+Text from $source:
+$text
 
 Return as JSON array:
 [
-  {{
+  {
     "title": "Job title",
     "company": "Company name",
     "location": "Location",
     "url": "URL or null",
     "description": "Brief description"
-  }}
+  }
 ]
 
 If no jobs found, return empty array [].
-"""
-            
-            response = self.model.generate_content(prompt)
-            jobs = json.loads(response.text.strip())
-            logger.info(f"📋 Extracted {len(jobs)} jobs from {source}")
-            
-            # Add metadata
-            for job in jobs:
-                job['site'] = source
-                job['scraped_at'] = datetime.now().isoformat()
-            
-            return jobs
-            
-        except Exception as e:
-            logger.error(f"Error extracting jobs from text: {e}")
-            return []
-    
-    async def find_company_career_pages(self, role: str, location: str = "India") -> List[Dict]:
-        """
-        Find relevant company career pages for a role
-        
-        Args:
-            role: Job role
-            location: Location
-        
-        Returns:
-            List of company career page URLs
-        """
-        try:
-            prompt = f"""
-List 15-20 companies in {location} that frequently hire for "{role}" positions.
+""")
+
+CAREER_PAGES_PROMPT = string.Template("""
+List 15-20 companies in $location that frequently hire for "$role" positions.
 
 Focus on:
 - Major tech companies
@@ -199,36 +117,16 @@ For each company provide:
 
 Return as JSON:
 [
-  {{
+  {
     "company": "Company Name",
     "careers_url": "https://...",
     "reason": "Why relevant"
-  }}
+  }
 ]
-"""
-            
-            response = self.model.generate_content(prompt)
-            companies = json.loads(response.text.strip())
-            logger.info(f"🏢 Found {len(companies)} companies hiring {role}")
-            return companies
-            
-        except Exception as e:
-            logger.error(f"Error finding company career pages: {e}")
-            return []
-    
-    async def suggest_networking_opportunities(self, role: str) -> List[Dict]:
-        """
-        Suggest LinkedIn groups, Slack communities, etc. where jobs are posted
-        
-        Args:
-            role: Job role
-        
-        Returns:
-            List of networking opportunities
-        """
-        try:
-            prompt = f"""
-List online communities, groups, and platforms where "{role}" jobs are frequently posted in India.
+""")
+
+NETWORKING_PROMPT = string.Template("""
+List online communities, groups, and platforms where "$role" jobs are frequently posted in India.
 
 Include:
 - LinkedIn groups
@@ -246,38 +144,17 @@ For each provide:
 
 Return as JSON:
 [
-  {{
+  {
     "platform": "Platform name",
     "name": "Group/Channel name",
     "access": "How to join",
     "activity": "High/Medium/Low"
-  }}
+  }
 ]
-"""
-            
-            response = self.model.generate_content(prompt)
-            opportunities = json.loads(response.text.strip())
-            logger.info(f"🌐 Found {len(opportunities)} networking opportunities")
-            return opportunities
-            
-        except Exception as e:
-            logger.error(f"Error finding networking opportunities: {e}")
-            return []
-    
-    async def analyze_job_market(self, role: str, location: str = "India") -> Dict:
-        """
-        Get market intelligence about a role
-        
-        Args:
-            role: Job role
-            location: Location
-        
-        Returns:
-            Market analysis dictionary
-        """
-        try:
-            prompt = f"""
-Provide a brief market analysis for "{role}" positions in {location}.
+""")
+
+MARKET_ANALYSIS_PROMPT = string.Template("""
+Provide a brief market analysis for "$role" positions in $location.
 
 Include:
 1. Demand level (High/Medium/Low)
@@ -288,7 +165,7 @@ Include:
 6. Best time to apply (if seasonal)
 
 Return as JSON:
-{{
+{
   "demand": "High/Medium/Low",
   "salary_range": "X-Y LPA",
   "top_cities": ["City1", "City2", "City3"],
@@ -296,37 +173,16 @@ Return as JSON:
   "trend": "Growing/Stable/Declining",
   "best_season": "Description",
   "advice": "2-3 sentence job search tip"
-}}
-"""
-            
-            response = self.model.generate_content(prompt)
-            analysis = json.loads(response.text.strip())
-            logger.info(f"📊 Generated market analysis for {role}")
-            return analysis
-            
-        except Exception as e:
-            logger.error(f"Error analyzing job market: {e}")
-            return {}
-    
-    async def optimize_search_strategy(self, role: str, user_profile: Dict) -> Dict:
-        """
-        Create a personalized job search strategy
-        
-        Args:
-            role: Target job role
-            user_profile: User's skills, experience, preferences
-        
-        Returns:
-            Search strategy recommendations
-        """
-        try:
-            prompt = f"""
+}
+""")
+
+STRATEGY_PROMPT = string.Template("""
 Create a personalized job search strategy for:
 
-Target Role: {role}
-User Experience: {user_profile.get('experience', 'Entry-level')}
-User Skills: {', '.join(user_profile.get('skills', ['General']))}
-Location Preference: {user_profile.get('location', 'Flexible')}
+Target Role: $role
+User Experience: $experience
+User Skills: $skills
+Location Preference: $location
 
 Provide:
 1. Priority job boards (top 5)
@@ -337,74 +193,253 @@ Provide:
 6. Application tips
 
 Return as JSON:
-{{
+{
   "priority_boards": ["Board1", "Board2", "Board3", "Board4", "Board5"],
   "keywords": ["keyword1", "keyword2", "keyword3"],
   "target_companies": ["Company1", "Company2", "Company3"],
   "highlight_skills": ["Skill1", "Skill2", "Skill3"],
   "avoid_flags": ["Flag1", "Flag2"],
   "tips": ["Tip1", "Tip2", "Tip3"]
-}}
-"""
-            
-            response = self.model.generate_content(prompt)
-            strategy = json.loads(response.text.strip())
+}
+""")
+
+HIDDEN_JOBS_PROMPT = string.Template("""
+List 10 ways to find "hidden" or unadvertised "$role" jobs in $location.
+
+Include:
+- Company referral programs
+- Cold email strategies
+- LinkedIn prospecting techniques
+- Twitter job hunting methods
+- Industry-specific forums
+- Meetup groups
+- Alumni networks
+- Recruiting agencies specializing in this role
+
+Return as JSON array of actionable tips:
+["Tip 1: Description", "Tip 2: Description", ...]
+""")
+
+
+class GeminiJobDiscovery:
+    def __init__(self, gemini_client):
+        """Initialize with Gemini AI client"""
+        self.gemini = gemini_client
+        self.model = gemini_client.model
+        logger.info("🔍 Gemini Job Discovery initialized")
+
+    async def discover_job_boards(self, role: str, location: str = "India") -> List[Dict]:
+        """
+        Use Gemini to discover job boards and sources for a specific role
+
+        Args:
+            role: Job role to search for
+            location: Location to search in
+
+        Returns:
+            List of job board URLs and search strategies
+        """
+        try:
+            prompt = DISCOVER_BOARDS_PROMPT.substitute(role=role, location=location)
+
+            sources = _parse_json(await self.gemini._cached_generate(prompt, json_mode=True))
+            logger.info(f"📍 Discovered {len(sources)} job sources for {role}")
+            return sources
+
+        except Exception as e:
+            logger.error(f"Error discovering job boards: {e}")
+            return []
+
+    async def generate_search_queries(self, role: str) -> List[str]:
+        """
+        Generate comprehensive search query variations using Gemini
+
+        Args:
+            role: Base job role
+
+        Returns:
+            List of search query variations
+        """
+        try:
+            prompt = SEARCH_QUERIES_PROMPT.substitute(role=role)
+
+            queries = _parse_json(await self.gemini._cached_generate(prompt, json_mode=True))
+            logger.info(f"🔤 Generated {len(queries)} distinct search variations for {role}")
+            return queries[:10]  # Limit to 10 max
+
+        except Exception as e:
+            logger.error(f"Error generating search queries: {e}")
+            return [role]
+
+    async def extract_jobs_from_text(self, text: str, source: str) -> List[Dict]:
+        """
+        Use Gemini to extract job listings from unstructured text
+
+        Args:
+            text: Raw text containing job information
+            source: Source website/platform
+
+        Returns:
+            List of extracted job dictionaries
+        """
+        try:
+            prompt = EXTRACT_JOBS_PROMPT.substitute(source=source, text=text[:3000])
+
+            jobs = _parse_json(await self.gemini._cached_generate(prompt, json_mode=True))
+            logger.info(f"📋 Extracted {len(jobs)} jobs from {source}")
+
+            # Add metadata
+            for job in jobs:
+                job['site'] = source
+                job['scraped_at'] = datetime.now().isoformat()
+
+            return jobs
+
+        except Exception as e:
+            logger.error(f"Error extracting jobs from text: {e}")
+            return []
+
+    async def find_company_career_pages(self, role: str, location: str = "India") -> List[Dict]:
+        """
+        Find relevant company career pages for a role
+
+        Args:
+            role: Job role
+            location: Location
+
+        Returns:
+            List of company career page URLs
+        """
+        try:
+            prompt = CAREER_PAGES_PROMPT.substitute(role=role, location=location)
+
+            companies = _parse_json(await self.gemini._cached_generate(prompt, json_mode=True))
+            logger.info(f"🏢 Found {len(companies)} companies hiring {role}")
+            return companies
+
+        except Exception as e:
+            logger.error(f"Error finding company career pages: {e}")
+            return []
+
+    async def suggest_networking_opportunities(self, role: str) -> List[Dict]:
+        """
+        Suggest LinkedIn groups, Slack communities, etc. where jobs are posted
+
+        Args:
+            role: Job role
+
+        Returns:
+            List of networking opportunities
+        """
+        try:
+            prompt = NETWORKING_PROMPT.substitute(role=role)
+
+            opportunities = _parse_json(await self.gemini._cached_generate(prompt, json_mode=True))
+            logger.info(f"🌐 Found {len(opportunities)} networking opportunities")
+            return opportunities
+
+        except Exception as e:
+            logger.error(f"Error finding networking opportunities: {e}")
+            return []
+
+    async def analyze_job_market(self, role: str, location: str = "India") -> Dict:
+        """
+        Get market intelligence about a role
+
+        Args:
+            role: Job role
+            location: Location
+
+        Returns:
+            Market analysis dictionary
+        """
+        try:
+            prompt = MARKET_ANALYSIS_PROMPT.substitute(role=role, location=location)
+
+            analysis = _parse_json(await self.gemini._cached_generate(prompt, json_mode=True))
+            logger.info(f"📊 Generated market analysis for {role}")
+            return analysis
+
+        except Exception as e:
+            logger.error(f"Error analyzing job market: {e}")
+            return {}
+
+    async def optimize_search_strategy(self, role: str, user_profile: Dict) -> Dict:
+        """
+        Create a personalized job search strategy
+
+        Args:
+            role: Target job role
+            user_profile: User's skills, experience, preferences
+
+        Returns:
+            Search strategy recommendations
+        """
+        try:
+            prompt = STRATEGY_PROMPT.substitute(
+                role=role,
+                experience=user_profile.get('experience', 'Entry-level'),
+                skills=', '.join(user_profile.get('skills', ['General'])),
+                location=user_profile.get('location', 'Flexible')
+            )
+
+            strategy = _parse_json(await self.gemini._cached_generate(prompt, json_mode=True))
             logger.info(f"🎯 Generated personalized search strategy")
             return strategy
-            
+
         except Exception as e:
             logger.error(f"Error optimizing search strategy: {e}")
             return {}
-    
+
     async def find_hidden_jobs(self, role: str, location: str = "India") -> List[str]:
         """
         Discover sources for "hidden" or unadvertised jobs
-        
+
         Args:
             role: Job role
             location: Location
-        
+
         Returns:
             List of tips and sources for hidden jobs
         """
         try:
-            prompt = f"""
-List 10 ways to find "hidden" or unadvertised "{role}" jobs in {location}.
-
-Include:
-- Company referral programs
-- Cold email strategies
-- LinkedIn prospecting techniques
-- Twitter job hunting methods
-- Industry-specific forums
-- Meetup groups
-- Alumni networks
-- Recruiting agencies specializing in this role
+            prompt = HIDDEN_JOBS_PROMPT.substitute(role=role, location=location)
 
-Return as JSON array of actionable tips:
-["Tip 1: Description", "Tip 2: Description", ...]
-"""
-            
-            response = self.model.generate_content(prompt)
-            tips = json.loads(response.text.strip())
+            tips = _parse_json(await self.gemini._cached_generate(prompt, json_mode=True))
             logger.info(f"🔐 Found {len(tips)} hidden job discovery methods")
             return tips
-            
+
         except Exception as e:
             logger.error(f"Error finding hidden jobs: {e}")
             return []
 
 
+# Shared instance, guarded like the GeminiAI singleton so concurrent
+# first callers don't each build their own discovery object
+_discovery_instance = None
+_discovery_lock = threading.Lock()
+
+
 def get_job_discovery(gemini_client) -> Optional[GeminiJobDiscovery]:
     """
-    Create job discovery instance
-    
+    Get or create the shared job discovery instance (thread-safe)
+
     Args:
         gemini_client: GeminiAI instance
-    
+
     Returns:
         GeminiJobDiscovery instance or None
     """
-    if gemini_client:
-        return GeminiJobDiscovery(gemini_client)
-    return None
+    global _discovery_instance
+
+    if not gemini_client:
+        return None
+
+    if _discovery_instance is not None and _discovery_instance.gemini is gemini_client:
+        return _discovery_instance
+
+    with _discovery_lock:
+        if _discovery_instance is None or _discovery_instance.gemini is not gemini_client:
+            _discovery_instance = GeminiJobDiscovery(gemini_client)
+
+    return _discovery_instance
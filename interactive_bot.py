@@ -3,9 +3,16 @@ Interactive Telegram Job Scraper Bot
 Asks user for job role and automatically scrapes related positions
 """
 
+import aiohttp
 import asyncio
+import copy
+import functools
+import html
 import logging
 import os
+import re
+import sys
+from dataclasses import dataclass, field
 from telegram import Update, ReplyKeyboardMarkup, ReplyKeyboardRemove
 from telegram.ext import (
     Application,
@@ -15,9 +22,17 @@ from telegram.ext import (
     ContextTypes,
     filters
 )
-from job_scraper import JobScraper
+from job_scraper import JobScraper, _fingerprint, _strip_url
 import yaml
 
+# libyaml-backed loader parses ~10x faster than the pure-Python one;
+# needs the libyaml system package, so fall back when PyYAML was built
+# without it
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
 # Configure logging
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -28,6 +43,70 @@ logger = logging.getLogger(__name__)
 # Conversation states
 ASKING_ROLE, CONFIRMING = range(2)
 
+# Cap on simultaneously registered searches - each one adds queries to
+# every scheduler tick, so an unbounded count melts the scrape cycle
+MAX_ACTIVE_SEARCHES = 50
+
+@dataclass(slots=True)
+class SearchState:
+    """One user's registered search: the role they asked for, the query
+    variations we scrape, and fingerprints of jobs already sent to them.
+
+    slots=True drops the per-instance __dict__ - these live for the
+    whole search and the scheduler touches them on every job."""
+    role: str
+    queries: list
+    seen: set = field(default_factory=set)
+
+
+# Matches values left as ${PLACEHOLDER} in config.yaml
+_ENV_RE = re.compile(r'^\$\{[^}]+\}$')
+
+# User-supplied text goes into parse_mode='HTML' replies; only &, <
+# and > need escaping there, versus the long Markdown special list
+def _html_escape(text: str) -> str:
+    """Escape HTML special characters in user-supplied text"""
+    return html.escape(str(text))
+
+
+def _resolve(value: str, env_key: str) -> str:
+    """
+    Resolve a config value against its environment variable
+
+    The env var wins when set or when the config still holds a
+    ${...} placeholder; otherwise the config value passes through.
+    """
+    if _ENV_RE.match(value) or os.getenv(env_key):
+        return os.getenv(env_key, value)
+    return value
+
+
+# Parsed config cache keyed by path - re-parsing config.yaml for every
+# user session is pure overhead, so repeat loads become a dict copy
+# while the file's (mtime, size) is unchanged
+_YAML_CACHE = {}
+
+
+def _load_yaml_cached(path: str) -> dict:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed config dict (a private copy, safe to mutate)
+    """
+    stat = os.stat(path)
+    cached = _YAML_CACHE.get(path)
+    if cached and cached[0] == (stat.st_mtime, stat.st_size):
+        return copy.deepcopy(cached[1])
+
+    with open(path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    _YAML_CACHE[path] = ((stat.st_mtime, stat.st_size), config)
+    return copy.deepcopy(config)
+
 # Job role mappings with related roles
 JOB_ROLE_MAPPINGS = {
     'data analyst': [
@@ -116,6 +195,76 @@ JOB_ROLE_MAPPINGS = {
     ]
 }
 
+# Interned keys/roles compare by pointer on the hot lookup path, and
+# tuple values let get_related_roles hand out the shared object instead
+# of copying a list per search
+JOB_ROLE_MAPPINGS = {
+    sys.intern(key): tuple(sys.intern(role) for role in roles)
+    for key, roles in JOB_ROLE_MAPPINGS.items()
+}
+
+# Pre-rendered bullet lists of related roles - known keys skip the
+# per-message .title() format loop in the /search handler
+JOB_ROLE_MAPPINGS_TITLED = {
+    key: "\n".join(f"  • {role.title()}" for role in roles)
+    for key, roles in JOB_ROLE_MAPPINGS.items()
+}
+
+# Inverted token index over the role mappings, built once at import -
+# fuzzy lookup becomes a dict hit plus a scan of a few candidate keys
+# instead of a substring pass over every mapping. Keys and index
+# entries are frozen so nothing can mutate them at runtime.
+_KEYS = frozenset(JOB_ROLE_MAPPINGS)
+_TOKEN_INDEX = {}
+for _key in _KEYS:
+    for _token in _key.split():
+        _TOKEN_INDEX.setdefault(_token, []).append(_key)
+_TOKEN_INDEX = {token: tuple(keys) for token, keys in _TOKEN_INDEX.items()}
+
+
+@functools.lru_cache(maxsize=512)
+def _related_roles(job_role: str):
+    """
+    Expand a normalized role into its related roles (pure, cached)
+
+    Args:
+        job_role: Lowercased, stripped role name
+
+    Returns:
+        Tuple of related role names (immutable, safe to share from cache)
+    """
+    # Exact match in mappings
+    if job_role in _KEYS:
+        return JOB_ROLE_MAPPINGS[job_role]
+
+    # Token index narrows the fuzzy check to keys sharing a word
+    candidates = set()
+    for token in job_role.split():
+        candidates.update(_TOKEN_INDEX.get(token, ()))
+    for key in candidates:
+        if key in job_role or job_role in key:
+            return JOB_ROLE_MAPPINGS[key]
+
+    # If no match, create a basic list with the input and variations
+    base_roles = [job_role]
+
+    # Add common variations
+    if 'analyst' in job_role:
+        if 'data' not in job_role:
+            base_roles.append(f"data {job_role}")
+        if 'business' not in job_role:
+            base_roles.append(f"business {job_role}")
+
+    if 'engineer' in job_role:
+        if 'data' not in job_role:
+            base_roles.append(f"data {job_role}")
+
+    if 'developer' in job_role:
+        base_roles.append(job_role.replace('developer', 'engineer'))
+
+    return tuple(base_roles[:5])  # Limit to 5 roles
+
+
 # Predefined role suggestions
 ROLE_KEYBOARD = [
     ['Data Analyst', 'Data Scientist'],
@@ -126,24 +275,147 @@ ROLE_KEYBOARD = [
     ['Custom Role (Type your own)']
 ]
 
+# The markup never changes, so build it once instead of per /search
+_ROLE_REPLY_MARKUP = ReplyKeyboardMarkup(ROLE_KEYBOARD, one_time_keyboard=True, resize_keyboard=True)
+
+# Stateless and immutable, so one instance serves every reply
+_REMOVE_KEYBOARD = ReplyKeyboardRemove()
+
+
+# Static reply texts, built once at import - the handlers run on the
+# bot's single event-loop thread, so per-message string assembly is
+# pure overhead for content that never changes
+_START_TEXT = (
+    "I'm your personal <b>Job Scraper Bot</b>. I'll help you find job opportunities "
+    "across multiple job sites in India!\n\n"
+    "🔍 I can search for:\n"
+    "• Data Analyst & related roles\n"
+    "• Data Scientist & ML Engineer roles\n"
+    "• Data Engineer & Big Data roles\n"
+    "• Business Analyst & related roles\n"
+    "• And many more...\n\n"
+    "Use /search to start finding jobs!\n"
+    "Use /stop to stop your active search\n"
+    "Use /status to check your current search"
+)
+
+_SEARCH_PROMPT_TEXT = (
+    "🎯 <b>What job role are you looking for?</b>\n\n"
+    "Select from the options below or type your own custom role:"
+)
+
+_FIND_USAGE_TEXT = (
+    "🤖 <b>AI-Powered Job Search</b>\n\n"
+    "Just tell me what you're looking for in plain English!\n\n"
+    "<b>Examples:</b>\n"
+    "• <code>/find python jobs in bangalore for freshers</code>\n"
+    "• <code>/find remote data analyst positions</code>\n"
+    "• <code>/find entry level business analyst in mumbai</code>\n"
+    "• <code>/find junior developer roles under 5 LPA</code>\n\n"
+    "I'll understand your request and start searching! ✨"
+)
+
+_DISCOVER_USAGE_TEXT = (
+    "🔍 <b>AI Job Discovery</b>\n\n"
+    "I'll find the best job boards and sources for your role!\n\n"
+    "<b>Usage:</b> <code>/discover <role></code>\n\n"
+    "<b>Examples:</b>\n"
+    "• <code>/discover data analyst</code>\n"
+    "• <code>/discover python developer</code>\n"
+    "• <code>/discover business analyst</code>"
+)
+
+_MARKET_USAGE_TEXT = (
+    "📊 <b>Job Market Analysis</b>\n\n"
+    "<b>Usage:</b> <code>/market <role></code>\n\n"
+    "<b>Example:</b> <code>/market data analyst</code>"
+)
+
+_ANALYZE_USAGE_TEXT = (
+    "🔬 <b>Deep Job Analysis</b>\n\n"
+    "Get comprehensive insights about a company!\n\n"
+    "<b>Usage:</b> <code>/analyze <company name></code>\n\n"
+    "<b>Examples:</b>\n"
+    "• <code>/analyze Google</code>\n"
+    "• <code>/analyze Accenture</code>\n"
+    "• <code>/analyze TCS</code>"
+)
+
+_STRATEGY_USAGE_TEXT = (
+    "🎯 <b>Personalized Search Strategy</b>\n\n"
+    "<b>Usage:</b> <code>/strategy <role></code>\n\n"
+    "<b>Example:</b> <code>/strategy junior data analyst</code>"
+)
+
+_AI_COMMANDS_TEXT = (
+    "/find <query> - Natural language search ✨\n"
+    "/discover <role> - Find job boards & sources 🔍\n"
+    "/market <role> - Market analysis & insights 📊\n"
+    "/strategy <role> - Personalized search strategy 🎯\n"
+    "/analyze <company> - Company analysis & insights 🔬\n"
+)
+
+_HELP_TEXT_TMPL = (
+    "🤖 <b>Job Scraper Bot - Help</b>\n\n"
+    "<b>Basic Commands:</b>\n"
+    "/start - Welcome message\n"
+    "/search - Guided job search\n"
+    "/stop - Stop your active search\n"
+    "/status - Check search status\n"
+    "/help - Show this help\n\n"
+    "<b>AI-Powered Commands:</b> ✨\n{ai_commands}\n"
+    "<b>How it works:</b>\n"
+    "1️⃣ Use /search or /find to start\n"
+    "2️⃣ Get smart AI summaries for each job\n"
+    "3️⃣ Notifications every 6 hours\n"
+    "4️⃣ Use AI commands for market insights\n\n"
+    "<b>Features:</b>\n"
+    "• AI job summaries & quality scores\n"
+    "• Market intelligence & trends\n"
+    "• Personalized search strategies\n"
+    "• Job board discovery"
+)
+
+
+class TelegramSender:
+    """
+    Rate-limit-aware wrapper around bot.send_message
+
+    Telegram caps bots at ~30 messages/second globally; bursts past
+    that draw 429s that stall every user. A semaphore holds senders
+    just under the cap and each slot is refunded a second after it was
+    taken, so sustained throughput stays at the limit without bursting
+    over it. Send failures are logged, not raised - one user's dead
+    chat must not break the loop for everyone else.
+    """
+
+    def __init__(self, bot, rate: int = 25):
+        self.bot = bot
+        self._credits = asyncio.Semaphore(rate)
+
+    async def send(self, chat_id, text, **kwargs):
+        await self._credits.acquire()
+        asyncio.get_running_loop().call_later(1.0, self._credits.release)
+        try:
+            return await self.bot.send_message(chat_id=chat_id, text=text, **kwargs)
+        except Exception as e:
+            logger.warning(f"Telegram send to {chat_id} failed: {e}")
+            return None
+
 
 class InteractiveJobBot:
     def __init__(self, config_path: str = 'config.yaml'):
-        with open(config_path, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f)
-        
+        self.config = _load_yaml_cached(config_path)
+
         # Override with environment variables if available or if placeholder is used
-        bot_token = self.config['telegram']['bot_token']
-        chat_id = self.config['telegram']['chat_id']
-        
-        # Check if values are placeholders or need env var override
-        if bot_token.startswith('${') or os.getenv('TELEGRAM_BOT_TOKEN'):
-            self.config['telegram']['bot_token'] = os.getenv('TELEGRAM_BOT_TOKEN', bot_token)
-        if chat_id.startswith('${') or os.getenv('TELEGRAM_CHAT_ID'):
-            self.config['telegram']['chat_id'] = os.getenv('TELEGRAM_CHAT_ID', chat_id)
-        
+        telegram = self.config['telegram']
+        telegram['bot_token'] = _resolve(telegram['bot_token'], 'TELEGRAM_BOT_TOKEN')
+        telegram['chat_id'] = _resolve(telegram['chat_id'], 'TELEGRAM_CHAT_ID')
+
         self.scraper = None
-        self.active_searches = {}  # Store active search tasks per user
+        self.active_searches = {}  # Per-user search registrations
+        self._session = None  # Shared aiohttp session across all users
+        self._scheduler_task = None  # Single scraping loop for all users
         
         # Initialize Gemini AI if enabled
         self.gemini = None
@@ -159,232 +431,304 @@ class InteractiveJobBot:
                     logger.info("🔍 Gemini Job Discovery enabled")
             except Exception as e:
                 logger.warning(f"⚠️ Could not initialize Gemini AI: {e}")
+
+        # Help text depends only on whether AI is enabled - render once
+        self._help_text = _HELP_TEXT_TMPL.format(
+            ai_commands=_AI_COMMANDS_TEXT if self.gemini else ""
+        )
     
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Start command - welcome message"""
         user = update.effective_user
         await update.message.reply_text(
-            f"👋 Hi {user.first_name}!\n\n"
-            f"I'm your personal **Job Scraper Bot**. I'll help you find job opportunities "
-            f"across multiple job sites in India!\n\n"
-            f"🔍 I can search for:\n"
-            f"• Data Analyst & related roles\n"
-            f"• Data Scientist & ML Engineer roles\n"
-            f"• Data Engineer & Big Data roles\n"
-            f"• Business Analyst & related roles\n"
-            f"• And many more...\n\n"
-            f"Use /search to start finding jobs!\n"
-            f"Use /stop to stop your active search\n"
-            f"Use /status to check your current search",
-            parse_mode='Markdown'
+            f"👋 Hi {_html_escape(user.first_name)}!\n\n{_START_TEXT}",
+            parse_mode='HTML'
         )
     
     async def search_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Start job search conversation"""
-        reply_markup = ReplyKeyboardMarkup(ROLE_KEYBOARD, one_time_keyboard=True, resize_keyboard=True)
-        
         await update.message.reply_text(
-            "🎯 **What job role are you looking for?**\n\n"
-            "Select from the options below or type your own custom role:",
-            reply_markup=reply_markup,
-            parse_mode='Markdown'
+            _SEARCH_PROMPT_TEXT,
+            reply_markup=_ROLE_REPLY_MARKUP,
+            parse_mode='HTML'
         )
         
         return ASKING_ROLE
     
     async def receive_role(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Receive job role from user"""
-        user_input = update.message.text.strip()
-        
+        msg = update.message
+        user_input = msg.text.strip()
+
         # Handle custom role option
         if user_input == "Custom Role (Type your own)":
-            await update.message.reply_text(
+            await msg.reply_text(
                 "✍️ Please type the job role you're looking for:\n"
                 "(e.g., 'Software Engineer', 'HR Manager', 'DevOps Engineer')",
-                reply_markup=ReplyKeyboardRemove()
+                reply_markup=_REMOVE_KEYBOARD
             )
             return ASKING_ROLE
-        
+
         # Store user's choice
-        context.user_data['job_role'] = user_input.lower()
-        
+        ud = context.user_data
+        role_key = user_input.lower()
+        ud['job_role'] = role_key
+
         # Get related roles
-        related_roles = self.get_related_roles(user_input.lower())
-        context.user_data['related_roles'] = related_roles
-        
-        # Show confirmation with related roles
-        roles_text = "\n".join([f"  • {role.title()}" for role in related_roles])
+        related_roles = self.get_related_roles(role_key)
+        ud['related_roles'] = related_roles
+
+        # Show confirmation with related roles (pre-rendered for known keys)
+        roles_text = JOB_ROLE_MAPPINGS_TITLED.get(role_key)
+        if roles_text is None:
+            roles_text = "\n".join([f"  • {role.title()}" for role in related_roles])
         
-        await update.message.reply_text(
-            f"✅ Got it! I'll search for **{user_input}**\n\n"
+        await msg.reply_text(
+            f"✅ Got it! I'll search for <b>{_html_escape(user_input)}</b>\n\n"
             f"📋 I'll also include these related roles:\n{roles_text}\n\n"
             f"🌍 Location: India (Bangalore, Mumbai, Delhi, Hyderabad, etc.)\n"
             f"🌐 Sites: LinkedIn, TimesJobs, Remotive, Naukri, Foundit, and more\n\n"
             f"⏰ I'll scrape jobs every 5 minutes and send you new opportunities!\n\n"
             f"Ready to start? Type 'YES' to begin or 'NO' to cancel.",
-            reply_markup=ReplyKeyboardRemove(),
-            parse_mode='Markdown'
+            reply_markup=_REMOVE_KEYBOARD,
+            parse_mode='HTML'
         )
         
         return CONFIRMING
     
     async def confirm_search(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Confirm and start scraping"""
-        user_response = update.message.text.strip().upper()
-        
+        msg = update.message
+        user_response = msg.text.strip().upper()
+
         if user_response not in ['YES', 'Y', 'START', 'OK']:
-            await update.message.reply_text(
+            await msg.reply_text(
                 "❌ Search cancelled. Use /search to start again."
             )
             return ConversationHandler.END
-        
+
         user_id = update.effective_user.id
-        job_role = context.user_data.get('job_role')
-        related_roles = context.user_data.get('related_roles', [])
-        
-        await update.message.reply_text(
-            f"🚀 Starting job search for **{job_role.title()}**!\n\n"
+        if user_id not in self.active_searches and \
+                len(self.active_searches) >= MAX_ACTIVE_SEARCHES:
+            await msg.reply_text(
+                "😓 Too many active searches right now. Please try again later."
+            )
+            return ConversationHandler.END
+
+        ud = context.user_data
+        job_role = ud.get('job_role')
+        related_roles = ud.get('related_roles', ())
+
+        await msg.reply_text(
+            f"🚀 Starting job search for <b>{_html_escape(job_role.title())}</b>!\n\n"
             f"🔄 Running first scrape now... (this may take 30-60 seconds)\n"
             f"⏱️ After that, I'll check every 5 minutes for new jobs.\n\n"
             f"📬 You'll receive notifications for each new job found!\n\n"
             f"Use /stop to stop the search anytime.",
-            parse_mode='Markdown'
-        )
-        
-        # Start background scraping task
-        task = asyncio.create_task(
-            self.run_continuous_scraping(user_id, related_roles, context.bot)
+            parse_mode='HTML'
         )
-        self.active_searches[user_id] = {
-            'task': task,
-            'role': job_role,
-            'queries': related_roles
-        }
         
+        # Register the search; one shared scheduler scrapes for everyone
+        self._register_search(user_id, job_role, related_roles, context.bot)
+
         return ConversationHandler.END
     
-    def get_related_roles(self, job_role: str):
+    @staticmethod
+    def get_related_roles(job_role: str):
         """Get related job roles based on user input"""
-        # Normalize input
-        job_role = job_role.lower().strip()
-        
-        # Check if exact match in mappings
-        if job_role in JOB_ROLE_MAPPINGS:
-            return JOB_ROLE_MAPPINGS[job_role]
-        
-        # Check if input contains key role names
-        for key, roles in JOB_ROLE_MAPPINGS.items():
-            if key in job_role or job_role in key:
-                return roles
-        
-        # If no match, create a basic list with the input and variations
-        base_roles = [job_role]
-        
-        # Add common variations
-        if 'analyst' in job_role:
-            if 'data' not in job_role:
-                base_roles.append(f"data {job_role}")
-            if 'business' not in job_role:
-                base_roles.append(f"business {job_role}")
-        
-        if 'engineer' in job_role:
-            if 'data' not in job_role:
-                base_roles.append(f"data {job_role}")
-        
-        if 'developer' in job_role:
-            base_roles.append(job_role.replace('developer', 'engineer'))
-        
-        return base_roles[:5]  # Limit to 5 roles
+        return _related_roles(job_role.lower().strip())
     
-    async def run_continuous_scraping(self, user_id: int, queries: list, bot):
-        """Run continuous scraping for a user"""
-        try:
-            # Load configuration
-            with open('config.yaml', 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            
-            # Override with environment variables if available or if placeholder is used
-            bot_token = config['telegram']['bot_token']
-            chat_id = config['telegram']['chat_id']
-            
-            # Check if values are placeholders or need env var override
-            if bot_token.startswith('${') or os.getenv('TELEGRAM_BOT_TOKEN'):
-                config['telegram']['bot_token'] = os.getenv('TELEGRAM_BOT_TOKEN', bot_token)
-            if chat_id.startswith('${') or os.getenv('TELEGRAM_CHAT_ID'):
-                config['telegram']['chat_id'] = os.getenv('TELEGRAM_CHAT_ID', chat_id)
-            
-            # Override telegram config to send to this specific user
-            config['telegram']['chat_id'] = str(user_id)
-            
-            # Initialize scraper with modified config
-            scraper = JobScraper(config)
-            
-            # Create aiohttp session for scraping
-            import aiohttp
-            from job_scraper import UserAgentRotator
-            timeout = aiohttp.ClientTimeout(total=30)
-            connector = aiohttp.TCPConnector(
-                limit=config.get('scraping', {}).get('connection_pool_size', 10),
-                limit_per_host=5
-            )
-            scraper.session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector,
-                headers={'User-Agent': UserAgentRotator.get_random()}
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared aiohttp session, creating it on first use
+
+        One connection pool serves every user's scraping, so concurrent
+        searches reuse keep-alive sockets and the DNS cache instead of
+        paying TCP/TLS handshakes per user. User-Agent rotation happens
+        per request inside JobScraper, not at session creation.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(
+                    limit=200,
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                )
             )
-            
-            cycle_count = 0
-            
-            while True:
+        return self._session
+
+    async def _close_session(self, application):
+        """Close the shared session once, at bot shutdown"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+            logger.info("🔌 Shared scraping session closed")
+
+    def _register_search(self, user_id: int, role: str, queries, bot):
+        """
+        Register a user's search with the shared scheduler
+
+        Re-registering overwrites the previous entry, so a user who
+        runs /search and then /find gets one search, not two.
+        """
+        self.active_searches[user_id] = SearchState(
+            role=role,
+            queries=list(dict.fromkeys(queries))
+        )
+        self._ensure_scheduler(bot)
+
+    def _ensure_scheduler(self, bot):
+        """Start the shared scheduler task if it isn't running yet"""
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = asyncio.create_task(self._scheduler_loop(bot))
+            self._scheduler_task.add_done_callback(self._on_scheduler_done)
+            logger.info("⏰ Shared scraping scheduler started")
+
+    def _on_scheduler_done(self, task):
+        """Surface scheduler crashes instead of silently dropping them"""
+        if self._scheduler_task is task:
+            self._scheduler_task = None
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            logger.error(f"Scheduler task died: {exc!r}", exc_info=exc)
+
+    async def _scheduler_loop(self, bot):
+        """
+        One scraping loop for every active user
+
+        Each tick scrapes the deduplicated union of all users' queries
+        once, then fans new jobs out per user. N users no longer mean N
+        offset scraping cycles hammering the same sites for overlapping
+        queries.
+        """
+        sender = TelegramSender(bot)
+        cycle_count = 0
+        try:
+            # One scraper for the bot's lifetime - construction loads the
+            # seen-jobs table, builds filters, and initializes the DB, so
+            # rebuilding it every time searches stop and restart is waste.
+            # JobScraper resolves its own env-var placeholders.
+            if self.scraper is None:
+                self.scraper = JobScraper(_load_yaml_cached('config.yaml'))
+            scraper = self.scraper
+            scraper.session = await self._get_session()
+
+            # Monotonic deadline keeps the cadence stable: without it
+            # each cycle fires interval + scrape_time after the last,
+            # drifting later and later as scrapes slow down
+            loop = asyncio.get_running_loop()
+            next_tick = loop.time()
+
+            # Read once: the interval isn't hot-reloadable mid-run, and
+            # the chained .get() allocations don't belong in the loop
+            interval = scraper.config.get('scraping', {}).get('interval', 300)
+
+            while self.active_searches:
                 cycle_count += 1
-                logger.info(f"Running scraping cycle {cycle_count} for user {user_id}")
-                
+                union = sorted(set().union(
+                    *(set(s.queries) for s in self.active_searches.values())
+                ))
+                logger.info(f"Running shared cycle {cycle_count} for "
+                            f"{len(self.active_searches)} user(s), {len(union)} queries")
+
                 try:
-                    # Run scraping cycle
-                    await scraper.run_scraping_cycle(queries)
-                    
+                    jobs = await scraper.scrape_all_sites(union)
+                    await self._dispatch_jobs(scraper, jobs)
+                    scraper.stats.record_cycle()
+
                     # Send status update every 10 cycles
                     if cycle_count % 10 == 0:
                         total_jobs = len(scraper.seen_jobs)
-                        await bot.send_message(
-                            chat_id=user_id,
-                            text=f"📊 Status Update (Cycle {cycle_count})\n"
-                                 f"💾 Total jobs tracked: {total_jobs}\n"
-                                 f"✅ Bot is running smoothly!\n\n"
-                                 f"Use /stop to stop the search."
-                        )
-                    
+                        for user_id in list(self.active_searches):
+                            await sender.send(
+                                user_id,
+                                f"📊 Status Update (Cycle {cycle_count})\n"
+                                f"💾 Total jobs tracked: {total_jobs}\n"
+                                f"✅ Bot is running smoothly!\n\n"
+                                f"Use /stop to stop the search."
+                            )
+
                 except Exception as e:
-                    logger.error(f"Error in scraping cycle for user {user_id}: {e}")
-                    await bot.send_message(
-                        chat_id=user_id,
-                        text=f"⚠️ Error in scraping cycle: {str(e)}\n"
-                             f"Will retry in next cycle..."
-                    )
-                
-                # Wait for next cycle (5 minutes)
-                interval = scraper.config.get('scraping', {}).get('interval', 300)
-                await asyncio.sleep(interval)
-                
+                    logger.error(f"Error in shared scraping cycle: {e}")
+                    for user_id in list(self.active_searches):
+                        await sender.send(
+                            user_id,
+                            f"⚠️ Error in scraping cycle: {str(e)}\n"
+                            f"Will retry in next cycle..."
+                        )
+
+                # Wait for the next deadline (5 minutes by default). If a
+                # scrape overran a whole interval, skip ahead rather than
+                # firing back-to-back catch-up cycles.
+                next_tick += interval
+                now = loop.time()
+                if next_tick < now:
+                    next_tick = now + interval
+                await asyncio.sleep(next_tick - now)
+
+            logger.info("No active searches left, scheduler exiting")
+
         except asyncio.CancelledError:
-            logger.info(f"Scraping stopped for user {user_id}")
-            # Close the session
-            if scraper.session:
-                await scraper.session.close()
-            await bot.send_message(
-                chat_id=user_id,
-                text="🛑 Job search stopped successfully!"
-            )
+            # The shared session stays open; only the loop stops
+            logger.info("Shared scraping scheduler stopped")
         except Exception as e:
-            logger.error(f"Fatal error in scraping for user {user_id}: {e}")
-            # Close the session
-            if scraper.session:
-                await scraper.session.close()
-            await bot.send_message(
-                chat_id=user_id,
-                text=f"❌ Fatal error: {str(e)}\n"
-                     f"Please use /search to start a new search."
-            )
+            logger.error(f"Fatal error in shared scraping scheduler: {e}")
+            for user_id in list(self.active_searches):
+                await sender.send(
+                    user_id,
+                    f"❌ Fatal error: {str(e)}\n"
+                    f"Please use /search to start a new search."
+                )
+            self.active_searches.clear()
+
+    async def _dispatch_jobs(self, scraper: JobScraper, jobs: list):
+        """
+        Filter, dedupe, and fan scraped jobs out to matching users
+
+        Global dedup uses the scraper's seen-jobs store; each user also
+        keeps a 'seen' set so joining mid-cycle never double-sends.
+        """
+        for job in jobs:
+            if not scraper.job_filter.matches(job):
+                scraper.stats.record_filtered()
+                continue
+
+            # Cheap URL-level reject before paying for normalization
+            quick_key = _strip_url(job['url'])
+            if quick_key and quick_key in scraper.seen_urls:
+                scraper.stats.record_duplicate()
+                continue
+
+            job_hash = scraper._hash_job(job)
+            fingerprint = _fingerprint(job_hash)
+            if scraper._is_duplicate(job_hash, fingerprint):
+                scraper.stats.record_duplicate()
+                continue
+
+            scraper.seen_jobs.add(fingerprint)
+            if quick_key:
+                scraper.seen_urls.add(quick_key)
+            scraper._save_job(job, job_hash)
+            scraper.stats.record_new(job['site'])
+
+            haystack = f"{job.get('title', '')} {job.get('description', '')}".lower()
+            for user_id, info in list(self.active_searches.items()):
+                if fingerprint in info.seen:
+                    continue
+                # With one user there is no ambiguity - everything scraped
+                # was scraped for them. Otherwise match on their queries.
+                if len(self.active_searches) > 1 and not any(
+                        q.lower() in haystack for q in info.queries):
+                    continue
+
+                info.seen.add(fingerprint)
+                scraper.config['telegram']['chat_id'] = str(user_id)
+                await scraper.send_telegram_message(job)
+
+        await asyncio.to_thread(scraper.flush_jobs)
     
     async def stop_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Stop active job search"""
@@ -397,16 +741,17 @@ class InteractiveJobBot:
             )
             return
         
-        # Cancel the task
-        search_info = self.active_searches[user_id]
-        search_info['task'].cancel()
-        
-        del self.active_searches[user_id]
-        
+        # Deregister; the shared scheduler stops once nobody is searching
+        search_info = self.active_searches.pop(user_id)
+        if not self.active_searches and self._scheduler_task:
+            self._scheduler_task.cancel()
+            self._scheduler_task = None
+
+
         await update.message.reply_text(
-            f"🛑 Stopped searching for **{search_info['role'].title()}** jobs.\n\n"
+            f"🛑 Stopped searching for <b>{_html_escape(search_info.role.title())}</b> jobs.\n\n"
             f"Use /search to start a new search anytime!",
-            parse_mode='Markdown'
+            parse_mode='HTML'
         )
     
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -421,23 +766,23 @@ class InteractiveJobBot:
             return
         
         search_info = self.active_searches[user_id]
-        queries_text = "\n".join([f"  • {q.title()}" for q in search_info['queries']])
-        
+        queries_text = "\n".join([f"  • {_html_escape(q.title())}" for q in search_info.queries])
+
         await update.message.reply_text(
-            f"🔄 **Active Search Status**\n\n"
-            f"🎯 Main Role: {search_info['role'].title()}\n"
+            f"🔄 <b>Active Search Status</b>\n\n"
+            f"🎯 Main Role: {_html_escape(search_info.role.title())}\n"
             f"📋 Searching for:\n{queries_text}\n\n"
             f"✅ Bot is actively running!\n"
             f"📬 You'll receive notifications for new jobs.\n\n"
             f"Use /stop to stop the search.",
-            parse_mode='Markdown'
+            parse_mode='HTML'
         )
     
     async def cancel(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Cancel conversation"""
         await update.message.reply_text(
             "❌ Cancelled. Use /search to start again.",
-            reply_markup=ReplyKeyboardRemove()
+            reply_markup=_REMOVE_KEYBOARD
         )
         return ConversationHandler.END
     
@@ -446,7 +791,7 @@ class InteractiveJobBot:
         if not self.gemini:
             await update.message.reply_text(
                 "⚠️ AI search is not available. Use /search for regular job search.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
             return
         
@@ -454,27 +799,17 @@ class InteractiveJobBot:
         query = ' '.join(context.args) if context.args else None
         
         if not query:
-            await update.message.reply_text(
-                "🤖 **AI-Powered Job Search**\n\n"
-                "Just tell me what you're looking for in plain English!\n\n"
-                "**Examples:**\n"
-                "• `/find python jobs in bangalore for freshers`\n"
-                "• `/find remote data analyst positions`\n"
-                "• `/find entry level business analyst in mumbai`\n"
-                "• `/find junior developer roles under 5 LPA`\n\n"
-                "I'll understand your request and start searching! ✨",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_FIND_USAGE_TEXT, parse_mode='HTML')
             return
         
         await update.message.reply_text(
             "🔍 Analyzing your request...",
-            parse_mode='Markdown'
+            parse_mode='HTML'
         )
         
         try:
             # Parse natural language query using Gemini
-            parsed = self.gemini.parse_natural_search(query)
+            parsed = await self.gemini.parse_natural_search(query)
             
             # Build response
             role = parsed.get('role', 'various positions')
@@ -482,25 +817,25 @@ class InteractiveJobBot:
             exp_level = parsed.get('experience_level', 'any level')
             
             await update.message.reply_text(
-                f"✅ **Understood!**\n\n"
-                f"**Role:** {role}\n"
-                f"**Location:** {location}\n"
-                f"**Experience:** {exp_level}\n\n"
+                f"✅ <b>Understood!</b>\n\n"
+                f"<b>Role:</b> {_html_escape(role)}\n"
+                f"<b>Location:</b> {_html_escape(location)}\n"
+                f"<b>Experience:</b> {_html_escape(exp_level)}\n\n"
                 f"Starting your job search now! 🚀\n"
                 f"You'll receive notifications for matching jobs.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
             
-            # Start search with parsed parameters
+            # Register with the shared scheduler like /search does
             user_id = update.effective_user.id
             queries = [role] + parsed.get('keywords', [])
-            await self.run_continuous_scraping(user_id, queries, update.get_bot())
+            self._register_search(user_id, role, queries, update.get_bot())
             
         except Exception as e:
             logger.error(f"Error in natural language search: {e}")
             await update.message.reply_text(
                 "❌ Sorry, I couldn't understand that. Try /search for a guided search.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
     
     async def discover_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -508,28 +843,19 @@ class InteractiveJobBot:
         if not self.job_discovery:
             await update.message.reply_text(
                 "⚠️ Job discovery requires Gemini AI. Please enable it first.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
             return
         
         role = ' '.join(context.args) if context.args else None
         
         if not role:
-            await update.message.reply_text(
-                "🔍 **AI Job Discovery**\n\n"
-                "I'll find the best job boards and sources for your role!\n\n"
-                "**Usage:** `/discover <role>`\n\n"
-                "**Examples:**\n"
-                "• `/discover data analyst`\n"
-                "• `/discover python developer`\n"
-                "• `/discover business analyst`",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_DISCOVER_USAGE_TEXT, parse_mode='HTML')
             return
         
         await update.message.reply_text(
-            f"🔍 Discovering job sources for **{role}**...",
-            parse_mode='Markdown'
+            f"🔍 Discovering job sources for <b>{_html_escape(role)}</b>...",
+            parse_mode='HTML'
         )
         
         try:
@@ -537,26 +863,27 @@ class InteractiveJobBot:
             sources = await self.job_discovery.discover_job_boards(role, "India")
             
             if sources:
-                message = f"✨ **Found {len(sources)} Job Sources for {role}:**\n\n"
-                for i, source in enumerate(sources[:8], 1):
-                    message += f"{i}. **{source['name']}**\n"
-                    message += f"   🔗 {source['url']}\n"
-                    message += f"   📊 Expected: {source['expected_count']} listings\n\n"
-                
-                message += "\n💡 **Tip:** Visit these sites directly for more opportunities!"
-                
-                await update.message.reply_text(message, parse_mode='Markdown', disable_web_page_preview=True)
+                parts = [f"✨ <b>Found {len(sources)} Job Sources for {_html_escape(role)}:</b>\n\n"]
+                parts.extend(
+                    f"{i}. <b>{source['name']}</b>\n"
+                    f"   🔗 {source['url']}\n"
+                    f"   📊 Expected: {source['expected_count']} listings\n\n"
+                    for i, source in enumerate(sources[:8], 1)
+                )
+                parts.append("\n💡 <b>Tip:</b> Visit these sites directly for more opportunities!")
+
+                await update.message.reply_text("".join(parts), parse_mode='HTML', disable_web_page_preview=True)
             else:
                 await update.message.reply_text(
                     "❌ Could not discover sources. Try again later.",
-                    parse_mode='Markdown'
+                    parse_mode='HTML'
                 )
                 
         except Exception as e:
             logger.error(f"Error in discover command: {e}")
             await update.message.reply_text(
                 "❌ Error discovering sources. Please try again.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
     
     async def market_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -564,50 +891,47 @@ class InteractiveJobBot:
         if not self.job_discovery:
             await update.message.reply_text(
                 "⚠️ Market analysis requires Gemini AI.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
             return
         
         role = ' '.join(context.args) if context.args else None
         
         if not role:
-            await update.message.reply_text(
-                "📊 **Job Market Analysis**\n\n"
-                "**Usage:** `/market <role>`\n\n"
-                "**Example:** `/market data analyst`",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_MARKET_USAGE_TEXT, parse_mode='HTML')
             return
         
         await update.message.reply_text(
-            f"📊 Analyzing job market for **{role}**...",
-            parse_mode='Markdown'
+            f"📊 Analyzing job market for <b>{_html_escape(role)}</b>...",
+            parse_mode='HTML'
         )
         
         try:
             analysis = await self.job_discovery.analyze_job_market(role, "India")
             
             if analysis:
-                message = f"📊 **Market Analysis: {role}**\n\n"
-                message += f"📈 **Demand:** {analysis.get('demand', 'N/A')}\n"
-                message += f"💰 **Salary:** {analysis.get('salary_range', 'N/A')}\n"
-                message += f"📍 **Top Cities:** {', '.join(analysis.get('top_cities', [])[:3])}\n"
-                message += f"🎯 **Key Skills:** {', '.join(analysis.get('key_skills', [])[:5])}\n"
-                message += f"📈 **Trend:** {analysis.get('trend', 'N/A')}\n\n"
-                message += f"💡 **Advice:** {analysis.get('advice', 'Keep applying!')}"
-                
-                await update.message.reply_text(message, parse_mode='Markdown')
+                message = (
+                    f"📊 <b>Market Analysis: {_html_escape(role)}</b>\n\n"
+                    f"📈 <b>Demand:</b> {analysis.get('demand', 'N/A')}\n"
+                    f"💰 <b>Salary:</b> {analysis.get('salary_range', 'N/A')}\n"
+                    f"📍 <b>Top Cities:</b> {', '.join(analysis.get('top_cities', [])[:3])}\n"
+                    f"🎯 <b>Key Skills:</b> {', '.join(analysis.get('key_skills', [])[:5])}\n"
+                    f"📈 <b>Trend:</b> {analysis.get('trend', 'N/A')}\n\n"
+                    f"💡 <b>Advice:</b> {analysis.get('advice', 'Keep applying!')}"
+                )
+
+                await update.message.reply_text(message, parse_mode='HTML')
             else:
                 await update.message.reply_text(
                     "❌ Could not analyze market. Try again later.",
-                    parse_mode='Markdown'
+                    parse_mode='HTML'
                 )
                 
         except Exception as e:
             logger.error(f"Error in market command: {e}")
             await update.message.reply_text(
                 "❌ Error analyzing market. Please try again.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
     
     async def analyze_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -615,57 +939,50 @@ class InteractiveJobBot:
         if not self.gemini:
             await update.message.reply_text(
                 "⚠️ Job analysis requires Gemini AI.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
             return
         
         query = ' '.join(context.args) if context.args else None
         
         if not query:
-            await update.message.reply_text(
-                "🔬 **Deep Job Analysis**\n\n"
-                "Get comprehensive insights about a company!\n\n"
-                "**Usage:** `/analyze <company name>`\n\n"
-                "**Examples:**\n"
-                "• `/analyze Google`\n"
-                "• `/analyze Accenture`\n"
-                "• `/analyze TCS`",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_ANALYZE_USAGE_TEXT, parse_mode='HTML')
             return
         
         await update.message.reply_text(
-            f"🔬 Analyzing **{query}**...",
-            parse_mode='Markdown'
+            f"🔬 Analyzing <b>{_html_escape(query)}</b>...",
+            parse_mode='HTML'
         )
         
         try:
             # Analyze company
-            insights = self.gemini.analyze_company(query)
+            insights = await self.gemini.analyze_company(query)
             
             if insights:
-                message = f"🔬 **Company Analysis: {query}**\n\n"
-                message += f"🏢 **Type:** {insights.get('type', 'Unknown')}\n"
-                message += f"🏭 **Industry:** {insights.get('industry', 'Unknown')}\n"
-                message += f"📊 **Size:** {insights.get('size', 'Unknown')}\n"
-                message += f"⭐ **Known For:** {insights.get('known_for', 'N/A')}\n"
-                message += f"💰 **Salary Rep:** {insights.get('salary_reputation', 'Unknown')}\n"
-                message += f"⚖️ **Work-Life:** {insights.get('work_life_balance', 'Unknown')}\n"
-                message += f"📈 **Growth:** {insights.get('growth_opportunities', 'Unknown')}\n\n"
-                message += f"💡 **Recommendation:**\n{insights.get('recommendation', 'Research before applying.')}"
-                
-                await update.message.reply_text(message, parse_mode='Markdown')
+                message = (
+                    f"🔬 <b>Company Analysis: {_html_escape(query)}</b>\n\n"
+                    f"🏢 <b>Type:</b> {insights.get('type', 'Unknown')}\n"
+                    f"🏭 <b>Industry:</b> {insights.get('industry', 'Unknown')}\n"
+                    f"📊 <b>Size:</b> {insights.get('size', 'Unknown')}\n"
+                    f"⭐ <b>Known For:</b> {insights.get('known_for', 'N/A')}\n"
+                    f"💰 <b>Salary Rep:</b> {insights.get('salary_reputation', 'Unknown')}\n"
+                    f"⚖️ <b>Work-Life:</b> {insights.get('work_life_balance', 'Unknown')}\n"
+                    f"📈 <b>Growth:</b> {insights.get('growth_opportunities', 'Unknown')}\n\n"
+                    f"💡 <b>Recommendation:</b>\n{insights.get('recommendation', 'Research before applying.')}"
+                )
+
+                await update.message.reply_text(message, parse_mode='HTML')
             else:
                 await update.message.reply_text(
                     "❌ Could not analyze. Try again later.",
-                    parse_mode='Markdown'
+                    parse_mode='HTML'
                 )
                 
         except Exception as e:
             logger.error(f"Error in analyze command: {e}")
             await update.message.reply_text(
                 "❌ Error analyzing. Please try again.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
     
     async def strategy_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -673,24 +990,19 @@ class InteractiveJobBot:
         if not self.job_discovery:
             await update.message.reply_text(
                 "⚠️ Strategy requires Gemini AI.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
             return
         
         role = ' '.join(context.args) if context.args else None
         
         if not role:
-            await update.message.reply_text(
-                "🎯 **Personalized Search Strategy**\n\n"
-                "**Usage:** `/strategy <role>`\n\n"
-                "**Example:** `/strategy junior data analyst`",
-                parse_mode='Markdown'
-            )
+            await update.message.reply_text(_STRATEGY_USAGE_TEXT, parse_mode='HTML')
             return
         
         await update.message.reply_text(
-            f"🎯 Creating strategy for **{role}**...",
-            parse_mode='Markdown'
+            f"🎯 Creating strategy for <b>{_html_escape(role)}</b>...",
+            parse_mode='HTML'
         )
         
         try:
@@ -703,73 +1015,39 @@ class InteractiveJobBot:
             strategy = await self.job_discovery.optimize_search_strategy(role, user_profile)
             
             if strategy:
-                message = f"🎯 **Search Strategy: {role}**\n\n"
-                message += f"**Priority Job Boards:**\n"
-                for board in strategy.get('priority_boards', [])[:5]:
-                    message += f"• {board}\n"
-                message += f"\n**Keywords to Use:**\n{', '.join(strategy.get('keywords', [])[:5])}\n"
-                message += f"\n**Target Companies:**\n"
-                for company in strategy.get('target_companies', [])[:3]:
-                    message += f"• {company}\n"
-                message += f"\n**Highlight Skills:**\n{', '.join(strategy.get('highlight_skills', [])[:4])}\n"
-                message += f"\n💡 **Tips:**\n"
-                for tip in strategy.get('tips', [])[:3]:
-                    message += f"• {tip}\n"
-                
-                await update.message.reply_text(message, parse_mode='Markdown')
+                parts = [f"🎯 <b>Search Strategy: {_html_escape(role)}</b>\n\n", "<b>Priority Job Boards:</b>\n"]
+                parts.extend(f"• {board}\n" for board in strategy.get('priority_boards', [])[:5])
+                parts.append(f"\n<b>Keywords to Use:</b>\n{', '.join(strategy.get('keywords', [])[:5])}\n")
+                parts.append("\n<b>Target Companies:</b>\n")
+                parts.extend(f"• {company}\n" for company in strategy.get('target_companies', [])[:3])
+                parts.append(f"\n<b>Highlight Skills:</b>\n{', '.join(strategy.get('highlight_skills', [])[:4])}\n")
+                parts.append("\n💡 <b>Tips:</b>\n")
+                parts.extend(f"• {tip}\n" for tip in strategy.get('tips', [])[:3])
+
+                await update.message.reply_text("".join(parts), parse_mode='HTML')
             else:
                 await update.message.reply_text(
                     "❌ Could not generate strategy. Try again later.",
-                    parse_mode='Markdown'
+                    parse_mode='HTML'
                 )
                 
         except Exception as e:
             logger.error(f"Error in strategy command: {e}")
             await update.message.reply_text(
                 "❌ Error generating strategy. Please try again.",
-                parse_mode='Markdown'
+                parse_mode='HTML'
             )
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show help message"""
-        ai_commands = ""
-        if self.gemini:
-            ai_commands = (
-                "/find <query> - Natural language search ✨\n"
-                "/discover <role> - Find job boards & sources 🔍\n"
-                "/market <role> - Market analysis & insights 📊\n"
-                "/strategy <role> - Personalized search strategy 🎯\n"
-                "/analyze <company> - Company analysis & insights 🔬\n"
-            )
-        
-        await update.message.reply_text(
-            "🤖 **Job Scraper Bot - Help**\n\n"
-            "**Basic Commands:**\n"
-            "/start - Welcome message\n"
-            "/search - Guided job search\n"
-            "/stop - Stop your active search\n"
-            "/status - Check search status\n"
-            "/help - Show this help\n\n"
-            f"**AI-Powered Commands:** ✨\n{ai_commands}\n"
-            "**How it works:**\n"
-            "1️⃣ Use /search or /find to start\n"
-            "2️⃣ Get smart AI summaries for each job\n"
-            "3️⃣ Notifications every 6 hours\n"
-            "4️⃣ Use AI commands for market insights\n\n"
-            "**Features:**\n"
-            "• AI job summaries & quality scores\n"
-            "• Market intelligence & trends\n"
-            "• Personalized search strategies\n"
-            "• Job board discovery",
-            parse_mode='Markdown'
-        )
+        await update.message.reply_text(self._help_text, parse_mode='HTML')
     
     def run(self):
         """Run the bot"""
         token = self.config['telegram']['bot_token']
         
-        # Create application
-        application = Application.builder().token(token).build()
+        # Create application; close the shared session exactly once on shutdown
+        application = Application.builder().token(token).post_shutdown(self._close_session).build()
         
         # Conversation handler for job search
         conv_handler = ConversationHandler(
@@ -796,12 +1074,43 @@ class InteractiveJobBot:
         # Start the bot
         logger.info("🤖 Interactive Job Scraper Bot started!")
         logger.info("Waiting for users to start job searches...")
-        
-        application.run_polling(allowed_updates=Update.ALL_TYPES)
+
+        # Webhook mode for deployments: Telegram pushes updates instead
+        # of the bot burning bandwidth on getUpdates long-polls. Polling
+        # stays the default since webhooks need a public HTTPS URL.
+        telegram_config = self.config['telegram']
+        if telegram_config.get('use_webhook') and telegram_config.get('public_url'):
+            public_url = telegram_config['public_url'].rstrip('/')
+            application.run_webhook(
+                listen='0.0.0.0',
+                port=int(os.getenv('PORT', '8443')),
+                url_path=token,
+                webhook_url=f"{public_url}/{token}",
+                allowed_updates=Update.ALL_TYPES
+            )
+        else:
+            # poll_interval=0 re-issues getUpdates immediately; with a
+            # 30s long-poll timeout the connection just idles server-side
+            # until an update arrives, so this is snappier without
+            # hammering the API.
+            application.run_polling(
+                poll_interval=0.0,
+                timeout=30,
+                allowed_updates=Update.ALL_TYPES
+            )
 
 
 def main():
     """Main entry point"""
+    # uvloop speeds up the I/O-bound event loop noticeably; optional
+    # since it isn't available on Windows
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("⚡ uvloop event loop installed")
+    except ImportError:
+        pass
+
     bot = InteractiveJobBot('config.yaml')
     bot.run()
 
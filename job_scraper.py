@@ -4,8 +4,11 @@ from bs4 import BeautifulSoup
 from telegram import Bot
 from telegram.error import TelegramError
 import sqlite3
+import functools
 import hashlib
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Set, Optional
 import logging
@@ -18,6 +21,8 @@ from pathlib import Path
 import json
 import os
 
+from _filters import filter_remotive, shape_remotive_job
+
 # Import stealth scrapers
 try:
     from stealth_scrapers import StealthBrowserScraper
@@ -25,6 +30,28 @@ try:
 except ImportError:
     STEALTH_AVAILABLE = False
 
+# Optional Aho-Corasick automaton for fast multi-keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Prefer lxml for HTML parsing - it's C-backed and several times faster
+# than the pure-Python html.parser on the 100KB+ pages the scrapers pull
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
+# Optional incremental JSON parsing for large API payloads
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Configure logging with rotation
 def setup_logging():
     """Setup logging with file rotation"""
@@ -54,6 +81,20 @@ def setup_logging():
 
 logger = setup_logging()
 
+# Compiled once at import - these patterns run on every job of every
+# cycle, so going through the re module's cache lookup each call adds up
+_NONWORD_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+_SALARY_NUM_RE = re.compile(r'\d+')
+_TITLE_LEVEL_RE = re.compile(r'\b(?:junior|senior|entry level)\b')
+# Haystacks are lowercased before matching, so no IGNORECASE needed;
+# plain substring alternation keeps the old `in`-check semantics
+_REMOTE_RE = re.compile(r'remote|work from home|wfh|telecommute')
+
+# Telegram MarkdownV2 escapes as a translation table - str.translate
+# makes one C-level pass instead of 18 chained str.replace passes
+_MD_ESCAPE_TABLE = str.maketrans({c: '\\' + c for c in '_*[]()~`>#+-=|{}.!'})
+
 
 class UserAgentRotator:
     """Rotates through realistic browser User-Agent strings"""
@@ -72,64 +113,171 @@ class UserAgentRotator:
     @classmethod
     def get_random(cls) -> str:
         """Get a random User-Agent string"""
-        return random.choice(cls.USER_AGENTS)
+        return _UA_TUPLE[_ua_randrange(_UA_COUNT)]
+
+
+# Frozen pool plus a pre-bound randrange: get_random runs once per HTTP
+# request, so skip the per-call attribute lookups random.choice does
+_UA_TUPLE = tuple(UserAgentRotator.USER_AGENTS)
+_UA_COUNT = len(_UA_TUPLE)
+_ua_randrange = random.randrange
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter, one per scraped site
+
+    Borrowed from TCP congestion control: every successful response
+    nudges the window up a quarter step, every 429/403 halves it. Sites
+    that tolerate load get probed harder; sites that throttle shrink to
+    a single in-flight request until they recover.
+    """
+
+    def __init__(self, start: int = 4, minimum: int = 1, maximum: int = 8):
+        self._limit = float(start)
+        self._min = minimum
+        self._max = maximum
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._cond:
+            while self._active >= int(self._limit):
+                await self._cond.wait()
+            self._active += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def record_success(self):
+        """Additive increase after a 2xx response"""
+        self._limit = min(float(self._max), self._limit + 0.25)
+
+    def record_throttle(self):
+        """Multiplicative decrease after a 429/403"""
+        self._limit = max(float(self._min), self._limit / 2)
+
+
+class KeywordMatcher:
+    """
+    Multi-keyword substring matcher
+
+    Compiles the keywords into an Aho-Corasick automaton when
+    pyahocorasick is installed, so the haystack is scanned once no
+    matter how many keywords there are. Falls back to plain `in` checks
+    otherwise. Keywords are casefolded at build time; pass
+    already-lowercased haystacks to matches().
+    """
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = [k.casefold() for k in keywords if k]
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def __bool__(self):
+        return bool(self.keywords)
+
+    def matches(self, haystack: str) -> bool:
+        """Check if any keyword occurs in the (lowercased) haystack"""
+        if self._automaton is not None:
+            return next(self._automaton.iter(haystack), None) is not None
+        return any(keyword in haystack for keyword in self.keywords)
+
+
+# Decoding and filtering a full Remotive payload is pure CPU that would
+# otherwise starve the event loop; hand it to a worker process instead.
+# Created lazily so runs that never hit the fallback path pay nothing.
+_PROCESS_POOL = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared worker pool for CPU-bound parsing"""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        _PROCESS_POOL = ProcessPoolExecutor(max_workers=1)
+    return _PROCESS_POOL
+
+
+def _parse_remotive_payload(raw: bytes, query: str, limit: int = 50) -> List[Dict]:
+    """
+    Decode and filter a raw Remotive payload (runs in a worker process)
+
+    Args:
+        raw: Undecoded JSON response body
+        query: Search query to match against title/category/description
+        limit: Maximum number of payload records to scan
+
+    Returns:
+        List of shaped job dicts matching the query
+    """
+    data = json.loads(raw)
+    return filter_remotive(data.get('jobs', []), query, limit)
 
 
 class JobFilter:
     """Advanced filtering for job listings"""
-    
+
     def __init__(self, config: Dict):
-        self.include_keywords = [k.lower() for k in (config.get('include_keywords') or [])]
-        self.exclude_keywords = [k.lower() for k in (config.get('exclude_keywords') or [])]
-        self.locations = [l.lower() for l in (config.get('locations') or [])]
-        self.exclude_locations = [l.lower() for l in (config.get('exclude_locations') or [])]
+        # Each keyword list becomes a KeywordMatcher: one automaton scan
+        # over the haystack instead of a Python loop of `in` checks
+        self.include_keywords = KeywordMatcher(config.get('include_keywords') or [])
+        self.exclude_keywords = KeywordMatcher(config.get('exclude_keywords') or [])
+        self.locations = KeywordMatcher(config.get('locations') or [])
+        self.exclude_locations = KeywordMatcher(config.get('exclude_locations') or [])
         self.min_salary = config.get('min_salary')
         self.max_salary = config.get('max_salary')
-        self.job_types = [jt.lower() for jt in (config.get('job_types') or [])]
-        self.experience_levels = [el.lower() for el in (config.get('experience_levels') or [])]
+        self.job_types = KeywordMatcher(config.get('job_types') or [])
+        self.experience_levels = KeywordMatcher(config.get('experience_levels') or [])
         self.remote_only = config.get('remote_only', False)
-        
+
     def matches(self, job: Dict) -> bool:
         """Check if job matches all filter criteria"""
         title_lower = job.get('title', '').lower()
         description_lower = job.get('description', '').lower()
         company_lower = job.get('company', '').lower()
         location_lower = job.get('location', '').lower()
-        
+
         # Combine text for keyword matching
         combined_text = f"{title_lower} {description_lower} {company_lower}"
-        
+
+        # Exclude keywords first (none should match) - with the default
+        # config this is the list that rejects most jobs
+        if self.exclude_keywords:
+            if self.exclude_keywords.matches(combined_text):
+                logger.debug(f"Filtered out (exclude keyword found): {job['title']}")
+                return False
+
         # Include keywords (at least one must match if specified)
         if self.include_keywords:
-            if not any(keyword in combined_text for keyword in self.include_keywords):
+            if not self.include_keywords.matches(combined_text):
                 logger.debug(f"Filtered out (no include keywords): {job['title']}")
                 return False
-        
-        # Exclude keywords (none should match)
-        if self.exclude_keywords:
-            if any(keyword in combined_text for keyword in self.exclude_keywords):
-                logger.debug(f"Filtered out (exclude keyword found): {job['title']}")
-                return False
-        
+
         # Location filtering
         if self.locations:
-            if not any(loc in location_lower for loc in self.locations):
+            if not self.locations.matches(location_lower):
                 logger.debug(f"Filtered out (location mismatch): {job['title']} - {job.get('location')}")
                 return False
-        
+
         # Exclude locations
         if self.exclude_locations:
-            if any(loc in location_lower for loc in self.exclude_locations):
+            if self.exclude_locations.matches(location_lower):
                 logger.debug(f"Filtered out (excluded location): {job['title']} - {job.get('location')}")
                 return False
-        
+
         # Remote filtering
         if self.remote_only:
-            remote_keywords = ['remote', 'work from home', 'wfh', 'telecommute']
-            if not any(keyword in combined_text or keyword in location_lower for keyword in remote_keywords):
+            if not (_REMOTE_RE.search(combined_text) or _REMOTE_RE.search(location_lower)):
                 logger.debug(f"Filtered out (not remote): {job['title']}")
                 return False
-        
+
         # Salary filtering
         if self.min_salary or self.max_salary:
             salary = self._extract_salary(job.get('salary', ''))
@@ -140,19 +288,19 @@ class JobFilter:
                 if self.max_salary and salary > self.max_salary:
                     logger.debug(f"Filtered out (salary too high): {job['title']}")
                     return False
-        
+
         # Job type filtering
         if self.job_types:
-            if not any(jt in combined_text or jt in location_lower for jt in self.job_types):
+            if not (self.job_types.matches(combined_text) or self.job_types.matches(location_lower)):
                 logger.debug(f"Filtered out (job type mismatch): {job['title']}")
                 return False
-        
+
         # Experience level filtering
         if self.experience_levels:
-            if not any(level in combined_text for level in self.experience_levels):
+            if not self.experience_levels.matches(combined_text):
                 logger.debug(f"Filtered out (experience level mismatch): {job['title']}")
                 return False
-        
+
         return True
     
     def _extract_salary(self, salary_str: str) -> Optional[int]:
@@ -164,7 +312,7 @@ class JobFilter:
         salary_str = salary_str.replace('$', '').replace(',', '').replace('k', '000').lower()
         
         # Extract numbers
-        numbers = re.findall(r'\d+', salary_str)
+        numbers = _SALARY_NUM_RE.findall(salary_str)
         if numbers:
             salary = int(numbers[0])
             
@@ -259,7 +407,86 @@ class StatsTracker:
         }
 
 
+@functools.lru_cache(maxsize=65536)
+def _normalize_title(title: str) -> str:
+    """Normalized form of a job title for hashing (pure, cached)
+
+    The same titles come back cycle after cycle, so the regex pipeline
+    runs once per distinct string instead of once per sighting."""
+    normalized = _NONWORD_RE.sub('', title.lower()).strip()
+    normalized = _TITLE_LEVEL_RE.sub('', normalized).strip()
+    return _WS_RE.sub(' ', normalized)
+
+
+@functools.lru_cache(maxsize=65536)
+def _normalize_company(company: str) -> str:
+    """Normalized form of a company name for hashing (pure, cached)"""
+    return _NONWORD_RE.sub('', company.lower()).strip()
+
+
+def _strip_url(url: str) -> str:
+    """Drop query params and anchors - some sites re-post the same job
+    under varying tracking parameters"""
+    return url.split('?', 1)[0].split('#', 1)[0]
+
+
+def _fingerprint(job_hash: str) -> int:
+    """
+    Collapse a job hash to a 64-bit int for in-memory dedup sets
+
+    Half the md5 digest is far beyond collision risk at this scale,
+    and set members cost ~8 bytes instead of a 32-char string. The
+    database keeps the full hex hash.
+    """
+    return int(job_hash[:16], 16)
+
+
+class LRUSet:
+    """
+    Set with a capacity cap that evicts its oldest members
+
+    seen_jobs used to grow without bound over a long-running search;
+    with a cap, memory stays O(maxsize) and membership checks remain
+    a single dict lookup. Evicted hashes are still covered by the
+    database's primary-key constraint, so a very old job resurfacing
+    only costs one duplicate-insert attempt, not a duplicate message.
+    """
+
+    def __init__(self, maxsize: int = 50_000, items=None):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        for item in items or ():
+            self.add(item)
+
+    def add(self, item):
+        self._items[item] = None
+        self._items.move_to_end(item)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+
 class JobScraper:
+    # Static browser-like headers sent with every fetch; built once so
+    # each retry attempt is a single dict merge instead of ten stores
+    _BASE_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'max-age=0'
+    }
+
     def __init__(self, config: Dict):
         self.config = config
         # Override with environment variables if available or if placeholder is used
@@ -285,13 +512,15 @@ class JobScraper:
         self.bot = Bot(token=self.telegram_token)
         self.db_path = config.get('database', {}).get('path', 'jobs.db')
         self.session = None
-        self.seen_jobs: Set[str] = set()
+        self.seen_jobs = LRUSet(maxsize=50_000)
+        self.seen_urls = LRUSet(maxsize=50_000)
         self.job_filter = JobFilter(config.get('filters', {}))
         self.stats = StatsTracker()
         
         # Initialize Gemini AI (optional)
         self.gemini = None
         self.job_discovery = None
+        self._enrich_memo = {}  # (title, company) -> enrichment result
         gemini_config = config.get('gemini', {})
         if gemini_config.get('enabled', False):
             try:
@@ -320,6 +549,13 @@ class JobScraper:
         # Proxy settings
         self.proxies = config.get('scraping', {}).get('proxies', [])
         self.current_proxy_index = 0
+
+        # Per-site AIMD limiters, created lazily on first fetch
+        self._site_limiters = {}
+
+        # Outbound notification queue, started lazily on first send
+        self._notify_queue = None
+        self._notify_task = None
         
         # Stealth mode settings
         self.use_stealth = config.get('scraping', {}).get('use_stealth_mode', False)
@@ -331,8 +567,18 @@ class JobScraper:
         self.max_consecutive_failures = config.get('monitoring', {}).get('max_consecutive_failures', 5)
         
         self._init_db()
+
+        # Long-lived connection for the hot write path; WAL lets readers
+        # coexist with the batched inserts and NORMAL sync drops the
+        # per-commit fsync that dominated the old per-job connections
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._pending_jobs = []
+
+        self._migrate_hashes()
         self._load_seen_jobs()
-        
+
     def _init_db(self):
         """Initialize SQLite database for job tracking"""
         conn = sqlite3.connect(self.db_path)
@@ -360,6 +606,31 @@ class JobScraper:
         conn.close()
         logger.info("Database initialized")
     
+    def _migrate_hashes(self):
+        """
+        One-shot rehash of rows keyed with the old md5 scheme
+
+        _hash_job moved from md5 to blake2b; without rewriting the
+        stored keys every previously seen job would look new and get
+        re-notified. Guarded by PRAGMA user_version so it runs once.
+        """
+        version = self._db.execute('PRAGMA user_version').fetchone()[0]
+        if version >= 1:
+            return
+        rows = self._db.execute(
+            'SELECT job_hash, title, company, url FROM jobs').fetchall()
+        with self._db:
+            for old_hash, title, company, url in rows:
+                new_hash = self._hash_job(
+                    {'title': title or '', 'company': company or '', 'url': url or ''})
+                if new_hash != old_hash:
+                    self._db.execute(
+                        'UPDATE OR IGNORE jobs SET job_hash = ? WHERE job_hash = ?',
+                        (new_hash, old_hash))
+            self._db.execute('PRAGMA user_version = 1')
+        if rows:
+            logger.info(f"Rehashed {len(rows)} stored jobs to the blake2b key scheme")
+
     def _load_seen_jobs(self):
         """Load previously seen jobs from database"""
         conn = sqlite3.connect(self.db_path)
@@ -367,63 +638,78 @@ class JobScraper:
         
         # Only load jobs from last 30 days to keep set manageable
         cutoff_date = datetime.now() - timedelta(days=30)
-        c.execute('SELECT job_hash FROM jobs WHERE scraped_at > ?', (cutoff_date,))
-        self.seen_jobs = {row[0] for row in c.fetchall()}
+        c.execute('SELECT job_hash, url FROM jobs WHERE scraped_at > ? ORDER BY scraped_at',
+                  (cutoff_date,))
+        rows = c.fetchall()
+        self.seen_jobs = LRUSet(maxsize=50_000,
+                                items=(_fingerprint(row[0]) for row in rows))
+        # First-level dedup keys: in steady state most scraped jobs are
+        # repeats, and a raw-URL hit skips the normalize-and-hash work
+        self.seen_urls = LRUSet(maxsize=50_000,
+                                items=(_strip_url(row[1]) for row in rows if row[1]))
         conn.close()
         logger.info(f"Loaded {len(self.seen_jobs)} previously seen jobs from last 30 days")
     
     def _hash_job(self, job: Dict) -> str:
         """Create unique hash for job to avoid duplicates"""
-        # Normalize title and company for better deduplication
-        title = re.sub(r'[^\w\s]', '', job['title'].lower()).strip()
-        company = re.sub(r'[^\w\s]', '', job['company'].lower()).strip()
-        
-        # Remove common variations
-        title = title.replace('junior', '').replace('senior', '').replace('entry level', '').strip()
-        title = re.sub(r'\s+', ' ', title)  # Normalize spaces
-        
+        # Normalize title and company for better deduplication; both
+        # normalizations are memoized across cycles
+        title = _normalize_title(job['title'])
+        company = _normalize_company(job['company'])
+
         # Use title, company for main uniqueness
         # URL as secondary (some sites post same job multiple times with different URLs)
-        url_normalized = job['url'].split('?')[0].split('#')[0]  # Remove query params and anchors
+        url_normalized = _strip_url(job['url'])
         unique_str = f"{title}||{company}||{url_normalized}"
-        return hashlib.md5(unique_str.encode()).hexdigest()
-    
-    def _is_similar_job(self, job1: Dict, job2: Dict) -> bool:
-        """Check if two jobs are similar (likely duplicates)"""
-        # Normalize titles for comparison
-        title1 = re.sub(r'[^\w\s]', '', job1['title'].lower()).strip()
-        title2 = re.sub(r'[^\w\s]', '', job2['title'].lower()).strip()
-        
-        # Same company and very similar titles = duplicate
-        if job1['company'].lower() == job2['company'].lower():
-            # Calculate simple word overlap
-            words1 = set(title1.split())
-            words2 = set(title2.split())
-            if len(words1) > 0 and len(words2) > 0:
-                overlap = len(words1 & words2) / min(len(words1), len(words2))
-                if overlap > 0.7:  # 70% word overlap
-                    return True
-        
+        # blake2b is the fastest stdlib hash on 64-bit; digest_size=16
+        # keeps the 32-char hex width of the old md5 keys
+        return hashlib.blake2b(unique_str.encode(), digest_size=16).hexdigest()
+
+    def _is_duplicate(self, job_hash: str, fingerprint: int) -> bool:
+        """
+        Check a job hash against the in-memory LRU, then the table
+
+        The LRU is capped at 50k entries, so a job evicted from memory
+        would otherwise look brand new and get re-notified; the
+        primary-key probe catches that without keeping every hash
+        resident. Confirmed hits are promoted back into the LRU.
+        """
+        if fingerprint in self.seen_jobs:
+            return True
+        if self._db.execute('SELECT 1 FROM jobs WHERE job_hash = ? LIMIT 1',
+                            (job_hash,)).fetchone():
+            self.seen_jobs.add(fingerprint)
+            return True
         return False
-    
+
     def _save_job(self, job: Dict, job_hash: str):
-        """Save job to database"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        try:
-            c.execute('''
-                INSERT INTO jobs (job_hash, title, company, url, location, salary, 
-                                  job_type, description, site, scraped_at)
+        """Queue a job for the end-of-cycle bulk insert"""
+        self._pending_jobs.append((
+            job_hash, job['title'], job['company'], job['url'],
+            job.get('location', ''), job.get('salary', ''),
+            job.get('job_type', ''), job.get('description', ''),
+            job['site'], datetime.now()))
+
+    def flush_jobs(self):
+        """
+        Write all queued jobs in one transaction
+
+        A cycle's worth of jobs lands with a single commit instead of a
+        connect/commit/close per job; INSERT OR IGNORE keeps the old
+        IntegrityError tolerance for hashes already in the table.
+        """
+        if not self._pending_jobs:
+            return
+        # Swap the batch out first so rows queued while the write runs
+        # in a worker thread land in the next flush
+        rows, self._pending_jobs = self._pending_jobs, []
+        with self._db:
+            self._db.executemany('''
+                INSERT OR IGNORE INTO jobs (job_hash, title, company, url, location, salary,
+                                            job_type, description, site, scraped_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (job_hash, job['title'], job['company'], job['url'], 
-                  job.get('location', ''), job.get('salary', ''),
-                  job.get('job_type', ''), job.get('description', ''),
-                  job['site'], datetime.now()))
-            conn.commit()
-        except sqlite3.IntegrityError:
-            pass  # Job already exists
-        finally:
-            conn.close()
+            ''', rows)
+        logger.debug(f"Flushed {len(rows)} jobs to database")
     
     def get_next_proxy(self) -> Optional[str]:
         """Get next proxy from rotation"""
@@ -442,39 +728,42 @@ class JobScraper:
                 delay = random.uniform(self.min_delay, self.max_delay)
                 await asyncio.sleep(delay)
                 
-                # Rotate User-Agent and add comprehensive headers
-                headers = kwargs.get('headers', {})
-                headers['User-Agent'] = UserAgentRotator.get_random()
-                headers['Accept'] = 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8'
-                headers['Accept-Language'] = 'en-US,en;q=0.9'
-                headers['Accept-Encoding'] = 'gzip, deflate, br'
-                headers['DNT'] = '1'
-                headers['Connection'] = 'keep-alive'
-                headers['Upgrade-Insecure-Requests'] = '1'
-                headers['Sec-Fetch-Dest'] = 'document'
-                headers['Sec-Fetch-Mode'] = 'navigate'
-                headers['Sec-Fetch-Site'] = 'none'
-                headers['Cache-Control'] = 'max-age=0'
-                kwargs['headers'] = headers
+                # Rotate User-Agent on top of the static header set;
+                # caller-provided headers still win over the base ones
+                kwargs['headers'] = {
+                    **self._BASE_HEADERS,
+                    **kwargs.get('headers', {}),
+                    'User-Agent': UserAgentRotator.get_random()
+                }
                 
                 # Add proxy if available
                 proxy = self.get_next_proxy()
                 if proxy:
                     kwargs['proxy'] = proxy
-                
-                async with self.session.get(url, **kwargs) as response:
-                    if response.status == 200:
-                        self.consecutive_failures = 0
-                        return await response.text()
-                    elif response.status == 429:  # Rate limited
-                        wait_time = self.retry_delay * (2 ** attempt)
-                        logger.warning(f"Rate limited on {site}, waiting {wait_time}s")
-                        await asyncio.sleep(wait_time)
-                    elif response.status == 403:  # Forbidden
-                        logger.warning(f"403 Forbidden on {site}, attempt {attempt + 1}")
-                        await asyncio.sleep(self.retry_delay * (2 ** attempt))
-                    else:
-                        logger.warning(f"HTTP {response.status} on {site}")
+
+                limiter = self._site_limiters.setdefault(site, AdaptiveLimiter())
+
+                # Hold a limiter slot only for the request itself so
+                # backoff sleeps don't starve the site's other fetches
+                async with limiter:
+                    async with self.session.get(url, **kwargs) as response:
+                        status = response.status
+                        if status == 200:
+                            self.consecutive_failures = 0
+                            limiter.record_success()
+                            return await response.text()
+
+                if status == 429:  # Rate limited
+                    limiter.record_throttle()
+                    wait_time = self.retry_delay * (2 ** attempt)
+                    logger.warning(f"Rate limited on {site}, waiting {wait_time}s")
+                    await asyncio.sleep(wait_time)
+                elif status == 403:  # Forbidden
+                    limiter.record_throttle()
+                    logger.warning(f"403 Forbidden on {site}, attempt {attempt + 1}")
+                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                else:
+                    logger.warning(f"HTTP {status} on {site}")
                         
             except asyncio.TimeoutError:
                 logger.warning(f"Timeout on {site}, attempt {attempt + 1}")
@@ -506,64 +795,61 @@ class JobScraper:
         company_insights = None
         competition_info = None
         
-        if self.gemini and gemini_config.get('features', {}).get('job_summarization', False):
-            try:
-                ai_summary = self.gemini.summarize_job(job)
-                logger.debug(f"✅ AI summary generated for {job['title']}")
-            except Exception as e:
-                error_msg = str(e).lower()
-                if 'quota' in error_msg or 'rate limit' in error_msg or '429' in error_msg:
-                    logger.error(f"⚠️ GEMINI QUOTA EXCEEDED: {e}")
-                    logger.error(f"⚠️ Gemini API daily limit reached! AI features disabled until reset.")
-                elif 'api key' in error_msg or 'authentication' in error_msg:
-                    logger.error(f"⚠️ GEMINI AUTH ERROR: Check your API key - {e}")
-                else:
-                    logger.warning(f"Failed to generate AI summary: {e}")
-        
-        if self.gemini and gemini_config.get('features', {}).get('job_quality_scoring', False):
-            try:
-                score_data = self.gemini.score_job_quality(job)
-                quality_score = score_data.get('score')
-            except Exception as e:
-                error_msg = str(e).lower()
-                if 'quota' not in error_msg and 'rate limit' not in error_msg:
-                    logger.warning(f"Failed to score job quality: {e}")
-        
-        # Estimate salary if not provided
-        if self.gemini and not job.get('salary'):
-            try:
-                salary_estimate = self.gemini.estimate_salary(job)
-            except Exception as e:
-                error_msg = str(e).lower()
-                if 'quota' not in error_msg and 'rate limit' not in error_msg:
-                    logger.warning(f"Failed to estimate salary: {e}")
-        
-        # Get company insights
-        if self.gemini and gemini_config.get('features', {}).get('company_analysis', True):
-            try:
-                company_insights = self.gemini.analyze_company(job.get('company', ''))
-            except Exception as e:
-                error_msg = str(e).lower()
-                if 'quota' not in error_msg and 'rate limit' not in error_msg:
-                    logger.warning(f"Failed to analyze company: {e}")
-        
-        # Estimate competition
-        if self.gemini and gemini_config.get('features', {}).get('competition_analysis', False):
-            try:
-                competition_info = self.gemini.estimate_competition(job)
-            except Exception as e:
-                error_msg = str(e).lower()
-                if 'quota' not in error_msg and 'rate limit' not in error_msg:
-                    logger.warning(f"Failed to estimate competition: {e}")
+        # Run all enabled AI enrichments concurrently - wall-clock cost is
+        # max(latency) instead of sum(latencies)
+        if self.gemini:
+            features = gemini_config.get('features', {})
+            want_summary = features.get('job_summarization', False)
+            want_score = features.get('job_quality_scoring', False)
+            want_salary = not job.get('salary')
+            want_company = features.get('company_analysis', True)
+            want_competition = features.get('competition_analysis', False)
+
+            if want_summary or want_score or want_salary or want_company or want_competition:
+                # Boards re-post the same job with a reworded description,
+                # which would miss the prompt-level cache - memoize on
+                # (title, company) so those repeats skip the LLM entirely
+                memo_key = (job.get('title', '').lower(), job.get('company', '').lower())
+                enriched = self._enrich_memo.get(memo_key)
+
+                # One multi-task call covers every enrichment for this job
+                if enriched is None:
+                    try:
+                        enriched = await self.gemini.enrich_job(job)
+                    except Exception as e:
+                        error_msg = str(e).lower()
+                        if 'quota' in error_msg or 'rate limit' in error_msg or '429' in error_msg:
+                            logger.error(f"⚠️ GEMINI QUOTA EXCEEDED: {e}")
+                            logger.error(f"⚠️ Gemini API daily limit reached! AI features disabled until reset.")
+                        elif 'api key' in error_msg or 'authentication' in error_msg:
+                            logger.error(f"⚠️ GEMINI AUTH ERROR: Check your API key - {e}")
+                        else:
+                            logger.warning(f"Gemini enrichment failed: {e}")
+                        enriched = {}
+                    if enriched:
+                        self._enrich_memo[memo_key] = enriched
+                        if len(self._enrich_memo) > 1024:
+                            # Drop the oldest entry (dicts keep insertion order)
+                            self._enrich_memo.pop(next(iter(self._enrich_memo)))
+
+                if want_summary:
+                    ai_summary = enriched.get('summary')
+                    if ai_summary:
+                        logger.debug(f"✅ AI summary generated for {job['title']}")
+                if want_score and enriched.get('score'):
+                    quality_score = enriched['score'].get('score')
+                if want_salary:
+                    salary_estimate = enriched.get('salary')
+                if want_company:
+                    company_insights = enriched.get('company')
+                if want_competition:
+                    competition_info = enriched.get('competition')
         
         # Escape Markdown special characters to avoid parsing errors
         def escape_markdown(text: str) -> str:
             """Escape special Markdown characters"""
-            special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-            for char in special_chars:
-                text = text.replace(char, f'\\{char}')
-            return text
-        
+            return text.translate(_MD_ESCAPE_TABLE)
+
         # Build message based on config
         quality_emoji = ""
         if quality_score:
@@ -639,20 +925,50 @@ class JobScraper:
         
         message = "\n".join(message_parts)
         
+        # Use chat_id from config (allows per-user messaging in interactive mode)
+        chat_id = self.config.get('telegram', {}).get('chat_id', self.chat_id)
+        await self._queue_notification(
+            chat_id, message, format_config.get('disable_preview', False))
+        logger.info(f"[QUEUED] {job['title']} at {job['company']} for user {chat_id}")
+
+    async def _queue_notification(self, chat_id, text: str, disable_preview: bool = False):
+        """Hand a rendered notification to the paced background sender"""
+        if self._notify_queue is None:
+            self._notify_queue = asyncio.Queue()
+            self._notify_task = asyncio.create_task(self._notification_worker())
+        await self._notify_queue.put((chat_id, text, disable_preview))
+
+    async def _notification_worker(self):
+        """
+        Drain queued notifications in windows of up to 25 per second
+
+        Telegram allows ~30 messages/s globally; sending a window
+        concurrently and sleeping between windows stays under that
+        while a burst of new jobs no longer serializes the scrape loop.
+        """
+        while True:
+            batch = [await self._notify_queue.get()]
+            while len(batch) < 25:
+                try:
+                    batch.append(self._notify_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            await asyncio.gather(*(self._send_notification(*item) for item in batch))
+            await asyncio.sleep(1)
+
+    async def _send_notification(self, chat_id, text: str, disable_preview: bool):
+        """Send one queued notification, swallowing Telegram errors"""
         try:
-            # Use chat_id from config (allows per-user messaging in interactive mode)
-            chat_id = self.config.get('telegram', {}).get('chat_id', self.chat_id)
             await self.bot.send_message(
                 chat_id=chat_id,
-                text=message,
+                text=text,
                 parse_mode='MarkdownV2',  # Use MarkdownV2 with escaped characters
-                disable_web_page_preview=format_config.get('disable_preview', False)
+                disable_web_page_preview=disable_preview
             )
-            logger.info(f"[SENT] {job['title']} at {job['company']} to user {chat_id}")
         except TelegramError as e:
             logger.error(f"Telegram error: {e}")
             self.stats.record_error()
-    
+
     async def send_alert(self, message: str):
         """Send alert message to Telegram"""
         try:
@@ -720,7 +1036,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             
             # Try multiple selectors as LinkedIn changes them frequently
             job_cards = soup.find_all('div', class_='base-card') or \
@@ -810,7 +1126,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             
             # LinkedIn post containers
             post_cards = soup.find_all('div', class_='feed-shared-update-v2') or \
@@ -957,7 +1273,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             
             # Try multiple selectors
             job_cards = soup.find_all('li', class_='react-job-listing') or \
@@ -1070,7 +1386,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             
             # Google's job cards (selectors change frequently)
             job_cards = soup.find_all('div', class_='PwjeAc') or \
@@ -1163,7 +1479,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             
             # Indeed job cards
             job_cards = soup.find_all('div', class_='job_seen_beacon') or \
@@ -1262,7 +1578,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             
             # Bing job cards (multiple possible selectors)
             job_cards = soup.find_all('li', class_='job-card') or \
@@ -1347,28 +1663,41 @@ class JobScraper:
         try:
             async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    
-                    query_lower = query.lower()
-                    for job_data in data.get('jobs', [])[:50]:  # Limit to 50
-                        title = job_data.get('title', '').lower()
-                        description = job_data.get('description', '').lower()
-                        category = job_data.get('category', '').lower()
-                        
-                        # Filter by query in title, description, or category
-                        if query_lower in title or query_lower in description or query_lower in category:
-                            job = {
-                                'title': job_data.get('title', ''),
-                                'company': job_data.get('company_name', ''),
-                                'url': job_data.get('url', ''),
-                                'location': 'Remote',
-                                'salary': job_data.get('salary', ''),
-                                'job_type': job_data.get('job_type', ''),
-                                'description': job_data.get('description', '')[:300],
-                                'site': site
-                            }
-                            jobs.append(job)
-                    
+                    # One compiled matcher and one lowercased haystack per
+                    # job, instead of three .lower() allocations + scans
+                    matcher = KeywordMatcher([query])
+
+                    def consider(job_data: Dict) -> Optional[Dict]:
+                        """Filter by query in title, category, or description"""
+                        # Small fields first: most matches hit the title,
+                        # sparing the casefold of a 5-50 KB description
+                        if not (matcher.matches(job_data.get('title', '').casefold())
+                                or matcher.matches(job_data.get('category', '').casefold())
+                                or matcher.matches(job_data.get('description', '').casefold())):
+                            return None
+                        return shape_remotive_job(job_data)
+
+                    if IJSON_AVAILABLE:
+                        # Stream-parse the (multi-MB) payload straight off
+                        # the response body; rejected jobs are freed as we
+                        # go instead of materializing everything up front
+                        scanned = 0
+                        async for job_data in ijson.items(response.content, 'jobs.item'):
+                            if scanned >= 50:  # Limit to 50
+                                break
+                            scanned += 1
+                            job = consider(job_data)
+                            if job:
+                                jobs.append(job)
+                    else:
+                        # Without streaming, decode + filter of the full
+                        # payload is 100-500ms of pure CPU - run it in the
+                        # worker process so other coroutines keep moving
+                        raw = await response.read()
+                        jobs = await asyncio.get_running_loop().run_in_executor(
+                            _get_process_pool(), _parse_remotive_payload, raw, query
+                        )
+
                     self.stats.record_scraped(site, len(jobs))
                     logger.info(f"Scraped {len(jobs)} jobs from {site}")
         except Exception as e:
@@ -1445,7 +1774,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             job_cards = soup.find_all('article', class_='jobTuple')
             
             for card in job_cards[:20]:  # Limit to 20 jobs
@@ -1506,7 +1835,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             # Try multiple selectors
             job_cards = soup.find_all('div', class_='jobTuple') or \
                        soup.find_all('article', class_='job-card') or \
@@ -1568,7 +1897,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             job_cards = soup.find_all('li', id=lambda x: x and x.startswith('id_')) or \
                        soup.find_all('div', class_='jobCard')
             
@@ -1631,7 +1960,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             job_cards = soup.find_all('li', class_='clearfix') or \
                        soup.find_all('article', class_='job')
             
@@ -1697,7 +2026,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             job_cards = soup.find_all('div', class_='opportunity-container') or \
                        soup.find_all('div', attrs={'data-opportunity-id': True})
             
@@ -1757,7 +2086,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             job_cards = soup.find_all('div', class_='job-card') or \
                        soup.find_all('article', attrs={'data-job-id': True})
             
@@ -1817,7 +2146,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             job_cards = soup.find_all('div', class_='new-job-box') or \
                        soup.find_all('div', class_='card-body')
             
@@ -1877,7 +2206,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             job_cards = soup.find_all('div', class_='job-box') or \
                        soup.find_all('div', class_='job-tile')
             
@@ -1937,7 +2266,7 @@ class JobScraper:
             return jobs
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             job_cards = soup.find_all('div', class_='job-container') or \
                        soup.find_all('div', class_='job-box')
             
@@ -2081,9 +2410,25 @@ class JobScraper:
             logger.warning("No sites enabled for scraping!")
             return all_jobs
         
-        # Run all scrapers concurrently
-        logger.info(f"Running {len(tasks)} scraping tasks concurrently...")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Bound the fan-out: queries x sites tasks all at once can blow
+        # past per-host connection limits and draw 429s/bans from the
+        # boards, which silently drops jobs
+        max_concurrent = self.config.get('scraping', {}).get('max_concurrent_scrapers', 8)
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def bounded(coro):
+            wait_start = time.time()
+            async with semaphore:
+                waited = time.time() - wait_start
+                if waited > 10:
+                    logger.warning(f"Scrape task waited {waited:.1f}s for a slot - "
+                                   f"consider raising max_concurrent_scrapers")
+                return await coro
+
+        # Run scrapers concurrently, at most max_concurrent at a time
+        logger.info(f"Running {len(tasks)} scraping tasks "
+                    f"(max {max_concurrent} concurrent)...")
+        results = await asyncio.gather(*(bounded(t) for t in tasks), return_exceptions=True)
         
         # Flatten results and track per-site success
         site_results = {}
@@ -2109,8 +2454,12 @@ class JobScraper:
         """Process scraped jobs, filter, and send new ones to Telegram"""
         new_jobs_count = 0
         site_job_counts = {}  # Track jobs per site for reporting
-        processed_jobs = []  # Store processed jobs for similarity checking
-        
+
+        # Word-sets of accepted titles, bucketed by company. Similarity
+        # only ever matches within one company, so each new job compares
+        # against its own company's titles instead of the last 100 jobs.
+        titles_by_company = {}
+
         # Group jobs by site for better distribution
         jobs_by_site = {}
         for job in jobs:
@@ -2138,43 +2487,59 @@ class JobScraper:
                     self.stats.record_filtered()
                     continue
                 
+                # Cheap URL-level reject before paying for normalization
+                quick_key = _strip_url(job['url'])
+                if quick_key and quick_key in self.seen_urls:
+                    self.stats.record_duplicate()
+                    continue
+
                 # Check for duplicates by hash
                 job_hash = self._hash_job(job)
-                
-                if job_hash in self.seen_jobs:
+                fingerprint = _fingerprint(job_hash)
+
+                if self._is_duplicate(job_hash, fingerprint):
                     self.stats.record_duplicate()
                     continue
                 
                 # Check for similar jobs (catch duplicates with slightly different titles/URLs)
+                company_key = job['company'].lower()
+                title_words = set(_NONWORD_RE.sub('', job['title'].lower()).strip().split())
                 is_similar = False
-                for processed_job in processed_jobs[-100:]:  # Check last 100 jobs
-                    if self._is_similar_job(job, processed_job):
-                        logger.debug(f"Similar job found: {job['title']} at {job['company']}")
-                        self.stats.record_duplicate()
-                        is_similar = True
-                        break
-                
+                if title_words:
+                    for words in titles_by_company.get(company_key, ()):
+                        overlap = len(words & title_words) / min(len(words), len(title_words))
+                        if overlap > 0.7:  # 70% word overlap
+                            logger.debug(f"Similar job found: {job['title']} at {job['company']}")
+                            self.stats.record_duplicate()
+                            is_similar = True
+                            break
+
                 if is_similar:
                     continue
-                
+
                 # New job found!
-                self.seen_jobs.add(job_hash)
+                self.seen_jobs.add(fingerprint)
+                if quick_key:
+                    self.seen_urls.add(quick_key)
                 self._save_job(job, job_hash)
                 self.stats.record_new(job['site'])
-                processed_jobs.append(job)
-                
+                if title_words:
+                    titles_by_company.setdefault(company_key, []).append(title_words)
+
                 # Track for reporting
                 if site not in site_job_counts:
                     site_job_counts[site] = 0
                 site_job_counts[site] += 1
                 
-                # Send to Telegram
+                # Send to Telegram (queued; the background worker paces
+                # sends in windows of 25/s to stay under Telegram's limit)
                 await self.send_telegram_message(job)
                 new_jobs_count += 1
-                
-                # Rate limit to avoid Telegram flooding (max 30 msgs/second)
-                await asyncio.sleep(0.5)
         
+        # sqlite releases the GIL during the write, so the fsync happens
+        # in a worker thread instead of stalling in-flight fetches
+        await asyncio.to_thread(self.flush_jobs)
+
         if new_jobs_count > 0:
             logger.info(f"✅ [NEW] Found {new_jobs_count} new jobs")
             logger.info(f"📊 [DISTRIBUTION] Jobs sent per site: {', '.join([f'{site}: {count}' for site, count in sorted(site_job_counts.items())])}")
@@ -2253,13 +2618,20 @@ class JobScraper:
             logger.error("No search queries configured!")
             return
         
-        # Create persistent aiohttp session for connection pooling
+        # Create persistent aiohttp session for connection pooling.
+        # DNS answers are cached for 5 minutes and idle connections kept
+        # alive for 60s, so repeat fetches to the same boards skip the
+        # resolve and TLS handshake between queries and cycles.
         timeout = aiohttp.ClientTimeout(total=30)
         connector = aiohttp.TCPConnector(
             limit=self.config.get('scraping', {}).get('connection_pool_size', 10),
-            limit_per_host=5
+            limit_per_host=5,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
         )
-        
+
         self.session = aiohttp.ClientSession(
             timeout=timeout,
             connector=connector,
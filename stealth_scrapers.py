@@ -12,6 +12,13 @@ from fake_useragent import UserAgent
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-backed lxml parser when available, like job_scraper does
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
 
 class StealthBrowserScraper:
     """Browser-based scraper with anti-detection measures"""
@@ -151,7 +158,7 @@ class StealthBrowserScraper:
             
             # Get page content
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, _SOUP_PARSER)
             
             # Parse jobs
             job_cards = soup.find_all('div', class_='job_seen_beacon') or \
@@ -242,7 +249,7 @@ class StealthBrowserScraper:
             
             # Get content
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, _SOUP_PARSER)
             
             # Parse jobs
             job_cards = soup.find_all('li', class_='react-job-listing') or \
@@ -326,7 +333,7 @@ class StealthBrowserScraper:
             
             # Get content
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, _SOUP_PARSER)
             
             # Parse jobs
             job_cards = soup.find_all('div', class_='PwjeAc') or \
@@ -2,11 +2,12 @@
 """
 Quick test script to check Gemini API status and quota
 """
+import asyncio
 import os
 import sys
 from gemini_ai import get_gemini_ai
 
-def test_gemini():
+async def test_gemini():
     """Test Gemini API connection and basic functionality"""
     
     print("🔍 Testing Gemini API...")
@@ -45,7 +46,7 @@ def test_gemini():
             'site': 'Test'
         }
         
-        summary = gemini.summarize_job(test_job)
+        summary = await gemini.summarize_job(test_job)
         print("✅ Summary generated successfully!")
         print(f"\nSummary:\n{summary}\n")
         
@@ -74,7 +75,7 @@ def test_gemini():
     # Test quality scoring
     try:
         print("⭐ Testing quality scoring...")
-        score_data = gemini.score_job_quality(test_job)
+        score_data = await gemini.score_job_quality(test_job)
         print(f"✅ Quality score: {score_data.get('score')}/10")
         print(f"   Reason: {score_data.get('reason', 'N/A')[:100]}...")
         
@@ -93,7 +94,7 @@ def test_gemini():
 
 if __name__ == "__main__":
     try:
-        success = test_gemini()
+        success = asyncio.run(test_gemini())
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\n⚠️  Test cancelled by user")